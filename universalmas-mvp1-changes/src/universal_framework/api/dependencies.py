@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from universal_framework.compliance.audit_manager import EnterpriseAuditManager
 
@@ -18,6 +18,7 @@ from universal_framework.session.contract_wrapper import (
     ContractEnterpriseSessionManager,
 )
 from universal_framework.session.session_manager import EnterpriseSessionManager
+from universal_framework.workflow.builder import create_redis_checkpointer
 
 
 def get_feature_flags():
@@ -27,18 +28,21 @@ def get_feature_flags():
 
 async def initialize_redis_connection() -> None:
     """Initialize Redis connection for API startup."""
-    global _redis_adapter
+    global _redis_adapter, _checkpointer
     try:
         config = WorkflowConfig()
         if config.enable_redis_optimization:
             adapter = RedisConnectionAdapter(config)
             await adapter.connect()
             _redis_adapter = adapter
+            if config.redis_url:
+                _checkpointer = await create_redis_checkpointer(config.redis_url)
     except Exception:  # noqa: BLE001
         pass
 
 
 _redis_adapter: RedisConnectionAdapter | None = None
+_checkpointer: Any | None = None
 _session_manager: EnterpriseSessionManager | None = None
 _session_storage: SessionStorage | None = None
 _contract_session_manager: ContractEnterpriseSessionManager | None = None
@@ -81,6 +85,11 @@ def get_redis_adapter() -> RedisConnectionAdapter | None:
     return _redis_adapter
 
 
+def get_checkpointer() -> Any | None:
+    """Return shared Redis checkpointer if one was initialized."""
+    return _checkpointer
+
+
 def get_session_storage() -> SessionStorage:
     """Return SessionStorage instance backed by Redis."""
     global _session_storage
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from universal_framework.api.dependencies import get_checkpointer
 from universal_framework.contracts.exceptions import APIValidationError
 from universal_framework.redis.session_storage import SessionStorage
 from universal_framework.workflow.builder import create_streamlined_workflow
@@ -68,6 +69,7 @@ class WorkflowRegistry:
 
         # Session storage integration from session propagation branch
         return create_streamlined_workflow(
+            checkpointer=get_checkpointer(),
             use_real_agents=config["use_real_agents"],
             enable_debug=config["enable_debug"],
             session_storage=session_storage,
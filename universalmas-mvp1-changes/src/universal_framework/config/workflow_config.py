@@ -42,6 +42,9 @@ class WorkflowConfig:
     redis_ttl_hours: str = field(
         default_factory=lambda: os.getenv("REDIS_TTL_HOURS", "24")
     )
+    redis_pool_size: str = field(
+        default_factory=lambda: os.getenv("REDIS_POOL_SIZE", "10")
+    )
 
     # Core Framework
     enable_debug: bool = field(
@@ -117,6 +120,7 @@ class WorkflowConfig:
 
         numeric_validations = {
             "redis_ttl_hours": (1, 8760),
+            "redis_pool_size": (1, 1000),
             "session_timeout_hours": (1, 72),
             "max_execution_time_seconds": (1, 300),
             "agent_timeout_seconds": (1, 30),
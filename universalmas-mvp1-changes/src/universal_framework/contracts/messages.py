@@ -47,6 +47,40 @@ def create_agent_message(
             actual_value=repr(from_agent),
         )
 
+    _validate_recipient_and_content(to_agent, content)
+
+    return AgentMessage(
+        content=content,
+        agent_name=from_agent,
+        phase=phase,
+        metadata=_agent_message_metadata(from_agent, to_agent, data),
+    )
+
+
+def readdress_agent_message(
+    template: AgentMessage,
+    to_agent: str,
+    content: str,
+    phase: WorkflowPhase,
+    data: dict[str, Any] | None = None,
+) -> AgentMessage:
+    """Copy a message from ``create_agent_message`` with a new recipient and body.
+
+    Skips model construction, which dominates ``create_agent_message``, so
+    senders that emit many messages can keep one template and copy it.
+    """
+    _validate_recipient_and_content(to_agent, content)
+
+    return template.model_copy(
+        update={
+            "content": content,
+            "phase": phase,
+            "metadata": _agent_message_metadata(template.agent_name, to_agent, data),
+        }
+    )
+
+
+def _validate_recipient_and_content(to_agent: str, content: str) -> None:
     if not to_agent or not to_agent.strip():
         raise StateValidationError(
             message="Recipient agent name cannot be empty",
@@ -63,18 +97,17 @@ def create_agent_message(
             actual_value=repr(content),
         )
 
-    return AgentMessage(
-        content=content,
-        agent_name=from_agent,
-        phase=phase,
-        metadata={
-            "from_agent": from_agent,
-            "to_agent": to_agent,
-            "data": data or {},
-            "timestamp": datetime.now().isoformat(),
-            "message_id": f"{from_agent}_{to_agent}_{datetime.now().timestamp()}",
-        },
-    )
+
+def _agent_message_metadata(
+    from_agent: str, to_agent: str, data: dict[str, Any] | None
+) -> dict[str, Any]:
+    return {
+        "from_agent": from_agent,
+        "to_agent": to_agent,
+        "data": data or {},
+        "timestamp": datetime.now().isoformat(),
+        "message_id": f"{from_agent}_{to_agent}_{datetime.now().timestamp()}",
+    }
 
 
 def extract_agent_messages(
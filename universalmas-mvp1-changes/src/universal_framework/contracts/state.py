@@ -5,7 +5,7 @@ from __future__ import annotations
 from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field
@@ -38,6 +38,20 @@ def get_compliance_context() -> dict[str, Any] | None:
     return _COMPLIANCE_CONTEXT.get()
 
 
+def merge_context_data(
+    current: dict[str, Any], update: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Reducer merging a node's ``context_data`` update into the current value.
+
+    Nodes may return only the keys they change; the merge happens once per
+    write inside LangGraph instead of every node copying the whole dict.
+    """
+
+    if not update:
+        return current
+    return {**current, **update}
+
+
 """
 Checkpoint Dictionary Structure:
 {
@@ -174,7 +188,10 @@ class UniversalWorkflowState(BaseModel):
     validation_results: dict[str, Any] = Field(default_factory=dict)
     final_outputs: dict[str, Any] = Field(default_factory=dict)
     audit_trail: list[dict[str, Any]] = Field(default_factory=list)
-    context_data: dict[str, Any] = Field(default_factory=dict)
+    # Merged per write, so nodes may return just the keys they change
+    context_data: Annotated[dict[str, Any], merge_context_data] = Field(
+        default_factory=dict
+    )
     error_info: dict[str, str] | None = None
 
     # Fields for enhanced error recovery and routing
@@ -197,6 +214,14 @@ class UniversalWorkflowState(BaseModel):
 
     def transition_to_phase(self, new_phase: WorkflowPhase) -> UniversalWorkflowState:
         """Return new state with updated workflow phase and previous tracking."""
+        return self.copy(update=self.phase_transition_updates(new_phase))
+
+    def phase_transition_updates(self, new_phase: WorkflowPhase) -> dict[str, Any]:
+        """Return the field updates that move this state to ``new_phase``.
+
+        Lets callers that copy the state anyway fold the transition into the
+        same ``copy`` instead of copying twice.
+        """
         # Use defensive state access utilities for LangGraph state conversion
         from universal_framework.utils.state_access import (
             safe_get,
@@ -208,13 +233,11 @@ class UniversalWorkflowState(BaseModel):
             self, "workflow_phase", WorkflowPhase, WorkflowPhase.INITIALIZATION
         )
 
-        return self.copy(
-            update={
-                "previous_phase": current_workflow_phase,
-                "workflow_phase": new_phase,
-                "phase_completion": {**current_phase_completion, new_phase.value: 0.0},
-            }
-        )
+        return {
+            "previous_phase": current_workflow_phase,
+            "workflow_phase": new_phase,
+            "phase_completion": {**current_phase_completion, new_phase.value: 0.0},
+        }
 
     def has_phase_transition(self) -> bool:
         """Return True if state represents an actual phase transition."""
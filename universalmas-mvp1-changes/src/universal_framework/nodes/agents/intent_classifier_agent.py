@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import re
 import time
+from collections import OrderedDict
 from enum import Enum
 from typing import Any
 
@@ -60,6 +61,9 @@ except ImportError:
 # Initialize enterprise logger
 logger = UniversalFrameworkLogger("intent_classifier_agent")
 
+# Structured-LLM classifications remembered per agent instance
+LLM_RESULT_CACHE_SIZE = 256
+
 
 class UserIntent(Enum):
     """Supported user intents for workflow routing."""
@@ -110,6 +114,11 @@ class IntentClassifierAgent:
         self.max_timeout = max_timeout
         self.max_retries = max_retries
 
+        # Repeat inputs ("hi", "help") skip the LLM round-trip
+        self._llm_result_cache: OrderedDict[str, IntentClassificationResult] = (
+            OrderedDict()
+        )
+
         # Initialize conversation-aware classifier if enabled
         self.conversation_aware_classifier = None
         if enable_conversation_aware:
@@ -300,7 +309,17 @@ class IntentClassifierAgent:
     async def _classify_with_structured_llm(
         self, user_input: str
     ) -> IntentClassificationResult | None:
-        """Use LangChain structured output for intent classification."""
+        """Use LangChain structured output for intent classification.
+
+        Confident results are cached by normalized input. This tier sees only
+        the user input, so a cached answer matches a fresh LLM call.
+        """
+        cache_key = " ".join(user_input.lower().split())
+        cached = self._llm_result_cache.get(cache_key)
+        if cached is not None:
+            self._llm_result_cache.move_to_end(cache_key)
+            return cached
+
         try:
             structured_llm = self.llm.with_structured_output(IntentClassificationResult)
         except Exception as e:
@@ -349,6 +368,9 @@ Be precise and confident in your classification. Consider the primary intent."""
                     intent=result.intent.value,
                     confidence=result.confidence,
                 )
+                self._llm_result_cache[cache_key] = result
+                if len(self._llm_result_cache) > LLM_RESULT_CACHE_SIZE:
+                    self._llm_result_cache.popitem(last=False)
                 return result
 
         except Exception as e:
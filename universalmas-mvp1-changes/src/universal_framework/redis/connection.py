@@ -47,10 +47,14 @@ class RedisConnectionAdapter(RedisConnectionInterface):
             )
         for attempt in range(self.max_retries):
             try:
-                self.connection_pool = redis.from_url(
+                # Bounded pool shared by every collaborator holding this adapter;
+                # callers wait for a free connection instead of opening new ones
+                pool = redis.BlockingConnectionPool.from_url(
                     connection_url,
+                    max_connections=int(self.config.redis_pool_size),
                     decode_responses=True,
                 )
+                self.connection_pool = redis.Redis.from_pool(pool)
                 await self.connection_pool.ping()
                 self.status = ConnectionStatus.CONNECTED
                 self.retry_count = 0
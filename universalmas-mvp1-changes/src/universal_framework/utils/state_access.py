@@ -30,8 +30,13 @@ References:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, TypeVar
 
+from pydantic import BaseModel
+
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
 from universal_framework.observability import UniversalFrameworkLogger
 
@@ -39,6 +44,44 @@ logger = UniversalFrameworkLogger("state_access")
 
 T = TypeVar("T")
 
+_EMPTY_VIEW: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted state path once and reuse the parts on later calls."""
+    return tuple(path.split("."))
+
+
+def _is_dict(value: Any) -> bool:
+    """Return True for dict state, checking the exact type before subclasses.
+
+    Most dict state is a plain ``dict``, so the pointer compare answers first;
+    the ``isinstance`` fallback covers LangGraph's dict subclasses such as
+    ``AddableValuesDict``.
+    """
+    return type(value) is dict or isinstance(value, dict)
+
+
+def as_state_view(state: Any) -> Mapping[str, Any]:
+    """Return a read-only mapping of state fields for dict or model state.
+
+    Decides the state's form once, so callers can read several fields with
+    plain ``.get`` instead of a ``hasattr`` check per field. Callers must not
+    mutate the result.
+
+    Args:
+        state: The state object (UniversalWorkflowState or dict)
+
+    Returns:
+        The dict itself, a proxy over the model's fields, or an empty mapping
+    """
+    if _is_dict(state):
+        return state
+    if isinstance(state, BaseModel):
+        return MappingProxyType(state.__dict__)
+    return _EMPTY_VIEW
+
 
 def safe_get(
     state: Any,
@@ -66,21 +109,23 @@ def safe_get(
         # Handle Pydantic model access
         if hasattr(state, key):
             value = getattr(state, key)
-        # Handle dict access
-        elif isinstance(state, dict) and key in state:
-            value = state[key]
-        # Handle nested dict access with dot notation
-        elif isinstance(state, dict) and "." in key:
-            keys = key.split(".")
-            current = state
-            for k in keys:
-                if isinstance(current, dict) and k in current:
-                    current = current[k]
-                else:
-                    return default
-            value = current
         else:
-            value = default
+            # Only reached for dict state or a model missing the attribute
+            is_dict = _is_dict(state)
+            # Handle dict access
+            if is_dict and key in state:
+                value = state[key]
+            # Handle nested dict access with dot notation
+            elif is_dict and "." in key:
+                current = state
+                for k in _split_path(key):
+                    if _is_dict(current) and k in current:
+                        current = current[k]
+                    else:
+                        return default
+                value = current
+            else:
+                value = default
 
         # Type conversion if requested
         if expected_type and value is not None:
@@ -238,7 +283,7 @@ def safe_get_audit_trail(state: Any) -> list[dict[str, Any]]:
 
 def safe_get_nested(
     state: Any,
-    path: str,
+    path: str | tuple[str, ...],
     expected_type: type[T] | None = None,
     default: T | None = None,
 ) -> T | Any:
@@ -247,7 +292,8 @@ def safe_get_nested(
 
     Args:
         state: The state object
-        path: Dot-separated path (e.g., "context_data.workflow_data")
+        path: Dot-separated path (e.g., "context_data.workflow_data"), or a
+            tuple of already-split keys
         expected_type: Optional type to convert the value to
         default: Default value if path not found
 
@@ -255,13 +301,13 @@ def safe_get_nested(
         The safely retrieved nested value
     """
     try:
-        keys = path.split(".")
+        keys = path if isinstance(path, tuple) else _split_path(path)
         current = state
 
         for key in keys:
             if hasattr(current, key):
                 current = getattr(current, key)
-            elif isinstance(current, dict) and key in current:
+            elif _is_dict(current) and key in current:
                 current = current[key]
             else:
                 return default
@@ -309,16 +355,28 @@ def validate_state_type(state: Any) -> tuple[bool, str]:
         return False, f"Unexpected type: {state_type}"
 
 
+_REQUIRED_STATE_KEYS = ("session_id", "user_id", "auth_token")
+
+
 def ensure_state_type(
     state: Any,
     expected_type: type = UniversalWorkflowState,
+    trusted: bool = False,
 ) -> UniversalWorkflowState:
     """
     Ensure state is of expected type, converting dict to Pydantic if necessary.
 
+    Dicts are validated by default. Callers that hold a dict produced by
+    LangGraph's own round-trip of an already validated model can pass
+    ``trusted=True`` to promote it with ``model_construct`` and skip the
+    per-field validator walk. A trusted dict must still carry the required
+    identity fields and an already-coerced ``WorkflowPhase``; otherwise it goes
+    through the validated path.
+
     Args:
         state: The state object
         expected_type: Expected type (defaults to UniversalWorkflowState)
+        trusted: Skip validation for dicts that came from a validated model
 
     Returns:
         Properly typed state object
@@ -326,6 +384,15 @@ def ensure_state_type(
     if isinstance(state, expected_type):
         return state
     elif isinstance(state, dict):
+        if (
+            trusted
+            and all(key in state for key in _REQUIRED_STATE_KEYS)
+            and isinstance(
+                state.get("workflow_phase", WorkflowPhase.INITIALIZATION),
+                WorkflowPhase,
+            )
+        ):
+            return expected_type.model_construct(**state)
         try:
             return expected_type(**state)
         except Exception as e:
@@ -361,10 +428,10 @@ if __name__ == "__main__":
         pydantic_state = UniversalWorkflowState(
             session_id="test-123",
             user_id="user-456",
-            auth_token="token-789",
+            auth_token="token-789-abc",
             workflow_phase=WorkflowPhase.STRATEGY_ANALYSIS,
             email_requirements=EmailRequirements(
-                purpose="Test email",
+                purpose="Test email purpose",
                 email_type="announcement",
                 audience=["test@example.com"],
                 tone="professional",
@@ -377,7 +444,7 @@ if __name__ == "__main__":
             safe_get(pydantic_state, "workflow_phase")
             == WorkflowPhase.STRATEGY_ANALYSIS
         )
-        assert safe_get_requirements(pydantic_state).purpose == "Test email"
+        assert safe_get_requirements(pydantic_state).purpose == "Test email purpose"
 
     except Exception as e:
         test_failures.append(f"Pydantic model test failed: {e}")
@@ -390,7 +457,7 @@ if __name__ == "__main__":
             "auth_token": "dict-token",
             "workflow_phase": "generation",
             "email_requirements": {
-                "purpose": "Dict test",
+                "purpose": "Dict test purpose",
                 "email_type": "update",
                 "audience": ["dict@test.com"],
                 "tone": "casual",
@@ -400,7 +467,7 @@ if __name__ == "__main__":
 
         assert safe_get(dict_state, "session_id") == "dict-123"
         assert safe_get_phase(dict_state) == WorkflowPhase.GENERATION
-        assert safe_get_requirements(dict_state)["purpose"] == "Dict test"
+        assert safe_get_requirements(dict_state)["purpose"] == "Dict test purpose"
 
     except Exception as e:
         test_failures.append(f"Dict access test failed: {e}")
@@ -468,6 +535,12 @@ if __name__ == "__main__":
         converted = ensure_state_type(dict_state)
         assert isinstance(converted, UniversalWorkflowState)
         assert converted.session_id == "dict-123"
+        assert converted.workflow_phase is WorkflowPhase.GENERATION
+        assert isinstance(converted.email_requirements, EmailRequirements)
+
+        trusted = ensure_state_type(dict(pydantic_state), trusted=True)
+        assert isinstance(trusted, UniversalWorkflowState)
+        assert trusted.email_requirements is pydantic_state.email_requirements
 
     except Exception as e:
         test_failures.append(f"State conversion test failed: {e}")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from enum import Enum
+from types import MappingProxyType
+from typing import ClassVar
 
 from universal_framework.contracts.state import EmailStrategy
 from universal_framework.contracts.templates import StoredTemplate
@@ -22,39 +25,30 @@ class EmailTemplateType(Enum):
 class EmailTemplateSelector:
     """Centralized email template selection logic for Universal Framework."""
 
+    # Shared, immutable keyword table. Iteration order is selection priority.
+    _TEMPLATE_KEYWORDS: ClassVar[Mapping[EmailTemplateType, frozenset[str]]] = (
+        MappingProxyType(
+            {
+                EmailTemplateType.POLICY_COMMUNICATION: frozenset(
+                    {"policy", "procedure", "compliance", "regulation"}
+                ),
+                EmailTemplateType.EDUCATIONAL_CONTENT: frozenset(
+                    {"training", "workshop", "learning", "education"}
+                ),
+                EmailTemplateType.EXECUTIVE_ANNOUNCEMENT: frozenset(
+                    {"announcement", "change", "important", "update"}
+                ),
+                EmailTemplateType.TEAM_NOTIFICATION: frozenset(
+                    {"team", "group", "department", "staff"}
+                ),
+                EmailTemplateType.MARKETING_PROMOTION: frozenset(
+                    {"promotion", "launch", "campaign", "offer"}
+                ),
+            }
+        )
+    )
+
     def __init__(self, template_store: TemplateStore | None = None) -> None:
-        self._template_keywords = {
-            EmailTemplateType.POLICY_COMMUNICATION: {
-                "policy",
-                "procedure",
-                "compliance",
-                "regulation",
-            },
-            EmailTemplateType.EDUCATIONAL_CONTENT: {
-                "training",
-                "workshop",
-                "learning",
-                "education",
-            },
-            EmailTemplateType.EXECUTIVE_ANNOUNCEMENT: {
-                "announcement",
-                "change",
-                "important",
-                "update",
-            },
-            EmailTemplateType.TEAM_NOTIFICATION: {
-                "team",
-                "group",
-                "department",
-                "staff",
-            },
-            EmailTemplateType.MARKETING_PROMOTION: {
-                "promotion",
-                "launch",
-                "campaign",
-                "offer",
-            },
-        }
         self.template_store = template_store
 
     def select_template(self, strategy: EmailStrategy | None) -> str:
@@ -65,8 +59,8 @@ class EmailTemplateSelector:
         content_keywords = set(re.findall(r"\b\w+\b", strategy.content.lower()))
         selected_template = EmailTemplateType.PROFESSIONAL_STANDARD
 
-        for template_type, keywords in self._template_keywords.items():
-            if any(keyword in content_keywords for keyword in keywords):
+        for template_type, keywords in self._TEMPLATE_KEYWORDS.items():
+            if not keywords.isdisjoint(content_keywords):
                 selected_template = template_type
                 break
 
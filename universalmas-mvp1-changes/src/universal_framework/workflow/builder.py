@@ -1,21 +1,34 @@
 """LangGraph StateGraph assembly with enterprise patterns and real agent integration."""
 
+import asyncio
 import os
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from types import MethodType
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType, MethodType
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
 
-try:  # langgraph>=0.5 uses memory saver
+# Optional checkpoint packages are probed with find_spec so a missing
+# package costs a path lookup rather than a raised ImportError
+SQLITE_AVAILABLE = find_spec("langgraph.checkpoint.sqlite") is not None
+if SQLITE_AVAILABLE:
     from langgraph.checkpoint.sqlite import SqliteSaver
-
-    SQLITE_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback
+else:  # pragma: no cover - langgraph>=0.5 uses memory saver
     from langgraph.checkpoint.memory import MemorySaver as SqliteSaver
 
-    SQLITE_AVAILABLE = False
+# Optional cross-worker checkpointing (langgraph-checkpoint-redis)
+if find_spec("langgraph.checkpoint.redis") is not None:
+    from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+else:  # pragma: no cover - package missing
+    AsyncRedisSaver = None
+
 from universal_framework.compliance import (
     EnterpriseAuditManager,
     FailClosedStateValidator,
@@ -28,16 +41,32 @@ from universal_framework.contracts.redis.interfaces import (
 )
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
 from universal_framework.observability import UniversalFrameworkLogger
+from universal_framework.workflow.error_recovery import AgentCircuitBreaker
 from universal_framework.workflow.orchestrator import (
     create_email_workflow_orchestrator,
 )
 from universal_framework.workflow.production_graph import (
     END,
+    START,
     CompiledEnterpriseGraph,
     EnterpriseGraphConfig,
     EnterpriseStateGraph,
 )
-from universal_framework.workflow.routing import EnhancedWorkflowRouter
+from universal_framework.workflow.routing import (
+    DEFAULT_ROUTING_CACHE_SIZE,
+    EnhancedWorkflowRouter,
+)
+
+try:  # Optional agent execution metrics
+    from universal_framework.observability import simple_metrics
+    from universal_framework.observability.simple_metrics import (
+        measure_agent_execution,
+    )
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - metrics optional
+    simple_metrics = None
+
+    def measure_agent_execution(agent_name: str, is_real_agent: bool) -> Any:
+        return nullcontext()
 
 try:  # Optional concrete session manager
     from universal_framework.redis.session_manager import (
@@ -51,7 +80,15 @@ except (
 
 # Import simulation agents (always available)
 from universal_framework.llm.providers import LLMConfig, LLMProvider, OpenAIProvider
+from universal_framework.redis.exceptions import SessionStorageError
 from universal_framework.redis.session_storage import SessionStorage
+from universal_framework.utils.state_access import (
+    ensure_state_type,
+    as_state_view,
+    safe_get,
+    safe_get_context_data,
+    safe_get_session_id,
+)
 from universal_framework.workflow.message_management import (
     MessageHistoryMode,
     create_message_aware_workflow_orchestrator,
@@ -67,6 +104,85 @@ from universal_framework.workflow.nodes import (
 
 # Initialize logger
 logger = UniversalFrameworkLogger("workflow_builder")
+intent_classifier_logger = UniversalFrameworkLogger("intent_classifier_node")
+
+# Session data fetched alongside intent classification, consumed by intent_gate
+_PREFETCHED_SESSIONS: dict[str, dict[str, Any] | None] = {}
+_MAX_PREFETCHED_SESSIONS = 1000
+
+# Intent message types that end the turn without entering the email workflow
+_HELP_MESSAGE_TYPES = frozenset({"help_response", "phase_specific_help"})
+
+# Shared worker pool for synchronous agents, sized once instead of per call
+_SYNC_AGENT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="sync_agent"
+)
+
+# Default cap on concurrently executing agents per enhanced workflow
+MAX_PARALLEL_AGENTS = int(os.environ.get("MAX_PARALLEL_AGENTS", "3"))
+
+# One breaker per agent so failure counts survive across calls and workflows
+_AGENT_CIRCUIT_BREAKERS: dict[str, AgentCircuitBreaker] = {}
+_agent_circuit_breakers_lock = threading.Lock()
+
+# Shared fallback intent results; state updates reference them, never mutate
+_FALLBACK_INTENT_RESULT: dict[str, Any] = {
+    "intent": "general_conversation",
+    "confidence": 0.3,
+    "message_type": "route_to_workflow",
+    "routing_destination": "email_workflow_orchestrator",
+}
+_FALLBACK_INTENT_RESULT_NO_MESSAGES: dict[str, Any] = {
+    **_FALLBACK_INTENT_RESULT,
+    "metadata": {"error": "no_messages", "classification_method": "fallback"},
+}
+_FALLBACK_INTENT_RESULT_NO_USER_MSG: dict[str, Any] = {
+    **_FALLBACK_INTENT_RESULT,
+    "metadata": {"error": "no_user_message", "classification_method": "fallback"},
+}
+
+# Intent message types that skip the workflow; everything else enters it
+_INTENT_ROUTES: dict[str, str] = dict.fromkeys(_HELP_MESSAGE_TYPES, END)
+
+# Agents the orchestrator may hand off to; anything else ends the turn
+_ORCHESTRATOR_TARGETS = frozenset(
+    {
+        "batch_requirements_collector",
+        "strategy_generator",
+        "strategy_confirmation_handler",
+        "enhanced_email_generator",
+    }
+)
+
+# WorkflowPhase is a str enum, so members hash like their values and both
+# phase strings and members resolve with one dict lookup
+_PHASE_LOOKUP: dict[str, WorkflowPhase] = {
+    phase.value: phase for phase in WorkflowPhase
+}
+
+# Context key each phase expects, with the severity and message when missing
+_PHASE_PREREQUISITES: dict[WorkflowPhase, tuple[str, str, str]] = {
+    WorkflowPhase.STRATEGY_ANALYSIS: (
+        "collected_requirements",
+        "warnings",
+        "No requirements collected for strategy analysis",
+    ),
+    WorkflowPhase.STRATEGY_CONFIRMATION: (
+        "generated_strategy",
+        "errors",
+        "No strategy generated for confirmation",
+    ),
+    WorkflowPhase.GENERATION: (
+        "approved_strategy",
+        "warnings",
+        "No approved strategy for generation",
+    ),
+}
+
+# Agents whose successors have no data dependency on each other
+_PARALLEL_SUCCESSORS: dict[str, tuple[str, ...]] = {
+    "enhanced_email_generator": ("quality_validator", "delivery_coordinator"),
+}
 
 # Import configuration system
 try:
@@ -79,12 +195,6 @@ except ImportError:
 # Import real agents (conditional)
 # Legacy agent imports removed - using modern node-based agents only
 REAL_AGENTS_AVAILABLE = False  # Force use of modern node-based agents
-try:
-    # Dummy try block for consistency with existing code structure
-    pass
-except ImportError:
-    REAL_AGENTS_AVAILABLE = False
-    real_requirements_collector = None
 
 
 class WorkflowBuilder:
@@ -181,6 +291,218 @@ def create_streamlined_workflow(
         )
     """
 
+    # Assembled graphs are shared per configuration; stateful collaborators
+    # (provider, Redis manager, session storage) always get a fresh assembly
+    assembly_args = (
+        use_real_agents,
+        message_history_mode,
+        enable_parallel,
+        enable_compliance,
+        llm_config_path,
+    )
+    history_items = tuple(sorted(message_history_kwargs.items()))
+    try:
+        hash(history_items)
+    except TypeError:
+        history_items = None
+    if (
+        history_items is not None
+        and llm_provider is None
+        and redis_session_manager is None
+        and session_storage is None
+    ):
+        workflow, validator = _assemble_streamlined_graph(
+            *assembly_args, history_items
+        )
+    else:
+        workflow, validator = _assemble_streamlined_graph.__wrapped__(
+            *assembly_args,
+            tuple(message_history_kwargs.items()),
+            llm_provider=llm_provider,
+            redis_session_manager=redis_session_manager,
+            session_storage=session_storage,
+        )
+
+    # Initialize performance configuration
+    perf_config = performance_config or {
+        "max_execution_time": 30.0,  # seconds
+        "agent_timeout": 5.0,  # seconds per agent
+        "checkpoint_interval": 10,  # save every N steps
+        "enable_metrics": True,
+        "message_management_enabled": message_history_mode
+        != MessageHistoryMode.FULL_HISTORY,
+        "message_filter_mode": message_history_mode.value,
+        "use_real_agents": use_real_agents,
+    }
+
+    # Configure checkpointing
+    if checkpointer is None:
+        if SQLITE_AVAILABLE:
+            checkpointer = SqliteSaver.from_conn_string(":memory:")
+        else:
+            checkpointer = SqliteSaver()  # MemorySaver doesn't use from_conn_string
+
+    # Compile with enterprise configuration and recursion limits
+    interrupt_nodes = []
+    if enable_debug:
+        interrupt_nodes = ["strategy_confirmation_handler"]
+
+    # Enhanced compilation configuration following LangGraph best practices
+    compile_config = {"checkpointer": checkpointer, "interrupt_before": interrupt_nodes}
+
+    # Try to compile with recursion_limit (newer LangGraph versions)
+    try:
+        compile_config["recursion_limit"] = (
+            200  # Further increased limit for production robustness
+        )
+        compiled_workflow = workflow.compile(**compile_config)
+    except TypeError as e:
+        # Fallback for older LangGraph versions that don't support recursion_limit
+        if "recursion_limit" in str(e):
+            compile_config.pop("recursion_limit", None)
+            compiled_workflow = workflow.compile(**compile_config)
+        else:
+            # Re-raise if it's a different TypeError
+            raise
+    except (RuntimeError, ImportError, AttributeError, ValueError) as e:
+        # Enhanced error reporting for compilation issues
+        raise RuntimeError(f"LangGraph workflow compilation failed: {e}") from e
+
+    if validator:
+        workflow_id = f"wf_{time.monotonic_ns():x}"
+        register_validator(workflow_id, validator)
+        compiled_workflow._validator = validator
+        compiled_workflow._workflow_id = workflow_id
+
+    # Add performance monitoring wrapper
+    if perf_config.get("enable_metrics"):
+        compiled_workflow = _add_performance_monitoring(compiled_workflow, perf_config)
+
+    # Placeholder for enhanced logging details removed after refactor
+    return compiled_workflow
+
+
+async def create_redis_checkpointer(redis_url: str) -> Any | None:
+    """Create a Redis checkpoint saver shared across workflows and workers.
+
+    Must run inside the event loop that executes the workflows. Returns None
+    when the saver package is missing or index setup fails, leaving callers
+    on the per-workflow in-memory default.
+    """
+
+    if AsyncRedisSaver is None:
+        logger.warning("redis_checkpoint_unavailable", reason="package_missing")
+        return None
+    try:
+        saver = AsyncRedisSaver(redis_url=redis_url)
+        await saver.asetup()
+    except Exception as exc:  # noqa: BLE001 - errors vary by Redis server
+        logger.warning("redis_checkpoint_unavailable", error=str(exc))
+        return None
+    return saver
+
+
+def create_enhanced_workflow(
+    use_case_config: dict[str, Any] | None = None,
+    checkpointer: SqliteSaver | None = None,
+    enable_parallel: bool = False,
+    performance_config: dict[str, Any] | None = None,
+    enable_debug: bool = False,
+    redis_session_manager: Any | None = None,
+    llm_provider: LLMProvider | None = None,
+) -> CompiledEnterpriseGraph:
+    """Create enhanced workflow with comprehensive routing."""
+
+    perf_config = performance_config or {
+        "max_execution_time": 30.0,
+        "agent_timeout": 5.0,
+        "checkpoint_interval": 5,
+        "enable_metrics": True,
+        "routing_cache_size": 1000,
+        "error_recovery_enabled": True,
+        "max_parallel_agents": MAX_PARALLEL_AGENTS,
+    }
+
+    routing_cache_size = perf_config.get("routing_cache_size", 0)
+    router = EnhancedWorkflowRouter(
+        use_case_config=use_case_config,
+        performance_mode=routing_cache_size > 0,
+        routing_cache_size=routing_cache_size or DEFAULT_ROUTING_CACHE_SIZE,
+    )
+
+    workflow_builder = WorkflowBuilder(llm_provider=llm_provider)
+
+    graph_config = EnterpriseGraphConfig(enable_compliance=True)
+    workflow = EnterpriseStateGraph(UniversalWorkflowState, graph_config)
+
+    # Admission control shared by every agent node in this workflow
+    agent_semaphore = asyncio.Semaphore(
+        perf_config.get("max_parallel_agents", MAX_PARALLEL_AGENTS)
+    )
+
+    agents = _get_universal_agent_list(use_case_config)
+    for agent_name in agents:
+        workflow.add_node(
+            agent_name,
+            _create_enhanced_agent_node(
+                agent_name,
+                workflow_builder=workflow_builder,
+                agent_semaphore=agent_semaphore,
+            ),
+        )
+
+    if enable_parallel:
+        workflow.add_node("quality_validator", _create_quality_validator())
+        workflow.add_node("delivery_coordinator", _create_delivery_coordinator())
+        workflow.add_node("parallel_synthesizer", _create_parallel_synthesizer())
+        workflow.add_edge("parallel_synthesizer", END)
+
+    _add_enhanced_conditional_edges(workflow, router, agents, enable_parallel)
+
+    entry_point = agents[0] if agents else "email_workflow_orchestrator"
+    workflow.set_entry_point(entry_point)
+
+    if checkpointer is None:
+        if SQLITE_AVAILABLE:
+            enhanced_checkpointer = SqliteSaver.from_conn_string(":memory:")
+        else:
+            enhanced_checkpointer = (
+                SqliteSaver()
+            )  # MemorySaver doesn't use from_conn_string
+    else:
+        enhanced_checkpointer = checkpointer
+    compiled_workflow = workflow.compile(
+        checkpointer=enhanced_checkpointer,
+        interrupt_before=(
+            ["escalation_handler", "human_intervention"] if enable_debug else None
+        ),
+        interrupt_after=["failure_analyst"] if enable_debug else None,
+    )
+
+    return compiled_workflow
+
+
+@lru_cache(maxsize=32)
+def _assemble_streamlined_graph(
+    use_real_agents: bool,
+    message_history_mode: MessageHistoryMode,
+    enable_parallel: bool,
+    enable_compliance: bool,
+    llm_config_path: str | None,
+    message_history_items: tuple[tuple[str, Any], ...],
+    llm_provider: LLMProvider | None = None,
+    redis_session_manager: RedisSessionManager | None = None,
+    session_storage: SessionStorage | None = None,
+) -> tuple[EnterpriseStateGraph, FailClosedStateValidator | None]:
+    """Build the uncompiled streamlined graph and its compliance validator.
+
+    Agent construction and node wiring dominate workflow creation, so the
+    result is cached per configuration. Compilation stays per call so each
+    workflow gets its own checkpointer.
+    """
+
+    message_history_kwargs = dict(message_history_items)
+
     # Setup observability if available and safe mode allows
     if CONFIG_AVAILABLE and feature_flags.is_enabled("LANGSMITH_TRACING"):
         setup_observability()
@@ -208,18 +530,6 @@ def create_streamlined_workflow(
             # Use safe mode - no enterprise audit manager in safe mode
             validator = None
 
-    # Initialize performance configuration
-    perf_config = performance_config or {
-        "max_execution_time": 30.0,  # seconds
-        "agent_timeout": 5.0,  # seconds per agent
-        "checkpoint_interval": 10,  # save every N steps
-        "enable_metrics": True,
-        "message_management_enabled": message_history_mode
-        != MessageHistoryMode.FULL_HISTORY,
-        "message_filter_mode": message_history_mode.value,
-        "use_real_agents": use_real_agents,
-    }
-
     # Create EnterpriseStateGraph with UniversalWorkflowState
     graph_config = EnterpriseGraphConfig(
         enable_compliance=enable_compliance,
@@ -259,56 +569,24 @@ def create_streamlined_workflow(
         state: UniversalWorkflowState,
     ) -> UniversalWorkflowState:
         """Enhanced intent classification node with conversation awareness."""
-        # Local logger for this function
-        local_logger = UniversalFrameworkLogger("intent_classifier_node")
+        # Normalize once so the body can use plain attribute access
+        state = ensure_state_type(state, trusted=True)
 
         try:
-            # Extract user input safely
-            messages = (
-                state.messages
-                if hasattr(state, "messages")
-                else state.get("messages", [])
-            )
+            messages = state.messages
             if not messages:
-                # Create fallback state for missing messages
                 return state.copy(
                     update={
-                        "intent_classification_result": {
-                            "intent": "general_conversation",
-                            "confidence": 0.3,
-                            "message_type": "route_to_workflow",
-                            "routing_destination": "email_workflow_orchestrator",
-                            "metadata": {
-                                "error": "no_messages",
-                                "classification_method": "fallback",
-                            },
-                        }
+                        "intent_classification_result": _FALLBACK_INTENT_RESULT_NO_MESSAGES
                     }
                 )
 
-            # Get last user message - FIXED: Handle None name attribute
-            last_user_message = None
-            for msg in reversed(messages):
-                if hasattr(msg, "content"):
-                    msg_name = getattr(msg, "name", "") or ""  # Handle None case
-                    if not msg_name.startswith("assistant"):
-                        last_user_message = msg.content
-                        break
+            last_user_message = _find_last_user_message(messages)
 
             if not last_user_message:
-                # Create fallback for no user input
                 return state.copy(
                     update={
-                        "intent_classification_result": {
-                            "intent": "general_conversation",
-                            "confidence": 0.3,
-                            "message_type": "route_to_workflow",
-                            "routing_destination": "email_workflow_orchestrator",
-                            "metadata": {
-                                "error": "no_user_message",
-                                "classification_method": "fallback",
-                            },
-                        }
+                        "intent_classification_result": _FALLBACK_INTENT_RESULT_NO_USER_MSG
                     }
                 )
 
@@ -344,11 +622,7 @@ def create_streamlined_workflow(
                 update={
                     "intent_classification_result": intent_result,
                     "context_data": {
-                        **(
-                            state.context_data
-                            if hasattr(state, "context_data")
-                            else state.get("context_data", {})
-                        ),
+                        **state.context_data,
                         "classified_intent": intent_result["intent"],
                         "message_type": intent_result["message_type"],
                     },
@@ -356,15 +630,12 @@ def create_streamlined_workflow(
             )
 
         except (AttributeError, KeyError, TypeError, TimeoutError) as e:
-            local_logger.error(f"Intent classification failed: {e}")
+            intent_classifier_logger.error(f"Intent classification failed: {e}")
             # Graceful fallback
             return state.copy(
                 update={
                     "intent_classification_result": {
-                        "intent": "general_conversation",
-                        "confidence": 0.3,
-                        "message_type": "route_to_workflow",
-                        "routing_destination": "email_workflow_orchestrator",
+                        **_FALLBACK_INTENT_RESULT,
                         "metadata": {
                             "error": str(e),
                             "classification_method": "error_fallback",
@@ -375,6 +646,14 @@ def create_streamlined_workflow(
 
     workflow.add_node("intent_classifier", intent_classifier_node)
 
+    # Overlap session prefetch with intent classification when storage is present
+    speculative_prefetch = session_storage is not None
+    if speculative_prefetch:
+        workflow.add_node(
+            "speculative_prefetch", _create_speculative_prefetch_node(session_storage)
+        )
+        workflow.add_node("intent_gate", _create_intent_gate_node())
+
     # Add selected agents (real or simulation)
     for agent_name, agent_func in agents.items():
         if validator:
@@ -388,34 +667,29 @@ def create_streamlined_workflow(
     if enable_parallel:
         workflow.add_node("quality_validator", _create_quality_validator())
         workflow.add_node("delivery_coordinator", _create_delivery_coordinator())
+        workflow.add_node("parallel_synthesizer", _create_parallel_synthesizer())
 
     # Set intent classifier as entry point instead of orchestrator (SalesGPT pattern)
-    workflow.set_entry_point("intent_classifier")
+    if speculative_prefetch:
+        workflow.add_edge(START, "intent_classifier")
+        workflow.add_edge(START, "speculative_prefetch")
+        workflow.add_edge(["intent_classifier", "speculative_prefetch"], "intent_gate")
+    else:
+        workflow.set_entry_point("intent_classifier")
 
     # Add conditional routing from intent classifier (similar to SalesGPT stage routing)
     def intent_router(state: UniversalWorkflowState) -> str:
         """Route based on intent classification results (SalesGPT-inspired pattern)."""
-        # Use defensive state access for LangGraph state conversion
         try:
-            from universal_framework.utils.state_access import safe_get
-
             intent_result = safe_get(state, "intent_classification_result", dict, {})
             message_type = intent_result.get("message_type", "route_to_workflow")
-
-            # Route based on message type (following SalesGPT conversation stage pattern)
-            match message_type:
-                case "help_response" | "phase_specific_help":
-                    return END  # Help responses are handled by intent classifier
-                case "route_to_workflow" | "email_request":
-                    return "email_workflow_orchestrator"  # Continue to workflow
-                case _:
-                    return "email_workflow_orchestrator"  # Default to workflow
-        except (ImportError, AttributeError, KeyError, TypeError):
+            return _INTENT_ROUTES.get(message_type, "email_workflow_orchestrator")
+        except (AttributeError, KeyError, TypeError):
             # Fallback to orchestrator on state access or routing errors
             return "email_workflow_orchestrator"
 
     workflow.add_conditional_edges(
-        "intent_classifier",
+        "intent_gate" if speculative_prefetch else "intent_classifier",
         intent_router,
         {
             "email_workflow_orchestrator": "email_workflow_orchestrator",
@@ -436,170 +710,150 @@ def create_streamlined_workflow(
         },
     )
 
-    # All agents report back to orchestrator (centralized coordination)
+    # Agents report back to orchestrator (centralized coordination), except
+    # where independent successors can fan out and rejoin at the synthesizer
     for agent_name in available_agents:
+        if enable_parallel and _add_parallel_fan_out(workflow, agent_name):
+            continue
         workflow.add_edge(agent_name, "email_workflow_orchestrator")
 
-    # Add parallel processing edges (if enabled)
     if enable_parallel:
-        workflow.add_edge(
-            "enhanced_email_generator", ["quality_validator", "delivery_coordinator"]
-        )
-        workflow.add_edge(["quality_validator", "delivery_coordinator"], END)
+        workflow.add_edge("parallel_synthesizer", END)
 
-    # Configure checkpointing
-    if checkpointer is None:
-        if SQLITE_AVAILABLE:
-            checkpointer = SqliteSaver.from_conn_string(":memory:")
-        else:
-            checkpointer = SqliteSaver()  # MemorySaver doesn't use from_conn_string
+    return workflow, validator
 
-    # Compile with enterprise configuration and recursion limits
-    interrupt_nodes = []
-    if enable_debug:
-        interrupt_nodes = ["strategy_confirmation_handler"]
 
-    # Enhanced compilation configuration following LangGraph best practices
-    compile_config = {"checkpointer": checkpointer, "interrupt_before": interrupt_nodes}
+def _find_last_user_message(messages: list[Any]) -> Any:
+    """Return content of the newest message not authored by an assistant.
 
-    # Try to compile with recursion_limit (newer LangGraph versions)
-    try:
-        compile_config["recursion_limit"] = (
-            200  # Further increased limit for production robustness
-        )
-        compiled_workflow = workflow.compile(**compile_config)
-    except TypeError as e:
-        # Fallback for older LangGraph versions that don't support recursion_limit
-        if "recursion_limit" in str(e):
-            compile_config.pop("recursion_limit", None)
-            compiled_workflow = workflow.compile(**compile_config)
-        else:
-            # Re-raise if it's a different TypeError
-            raise
-    except (RuntimeError, ImportError, AttributeError, ValueError) as e:
-        # Enhanced error reporting for compilation issues
-        raise RuntimeError(f"LangGraph workflow compilation failed: {e}") from e
+    Scans backwards and stops at the first match, which is normally the
+    final message of the turn.
+    """
 
-    if validator:
-        workflow_id = f"wf_{datetime.now().timestamp()}"
-        register_validator(workflow_id, validator)
-        compiled_workflow._validator = validator
-        compiled_workflow._workflow_id = workflow_id
+    for msg in reversed(messages):
+        content = getattr(msg, "content", None)
+        if content is None:
+            continue
+        # name may be None on LangChain messages
+        if not (getattr(msg, "name", None) or "").startswith("assistant"):
+            return content
+    return None
 
-    # Add performance monitoring wrapper
-    if perf_config.get("enable_metrics"):
-        compiled_workflow = _add_performance_monitoring(compiled_workflow, perf_config)
 
-    # Placeholder for enhanced logging details removed after refactor
-    return compiled_workflow
+def _create_speculative_prefetch_node(
+    session_storage: SessionStorage,
+) -> Callable[[UniversalWorkflowState], Any]:
+    """Create node that loads session data while intent classification runs."""
 
+    async def speculative_prefetch(state: UniversalWorkflowState) -> dict[str, Any]:
+        session_id = safe_get_session_id(state)
+        try:
+            session_data = await session_storage.get_session_data(session_id)
+        except SessionStorageError as exc:
+            logger.warning(
+                "speculative_prefetch_failed", session=session_id[:8], error=str(exc)
+            )
+            session_data = None
 
-def create_enhanced_workflow(
-    use_case_config: dict[str, Any] | None = None,
-    checkpointer: SqliteSaver | None = None,
-    enable_parallel: bool = False,
-    performance_config: dict[str, Any] | None = None,
-    enable_debug: bool = False,
-    redis_session_manager: Any | None = None,
-    llm_provider: LLMProvider | None = None,
-) -> CompiledEnterpriseGraph:
-    """Create enhanced workflow with comprehensive routing."""
+        if len(_PREFETCHED_SESSIONS) >= _MAX_PREFETCHED_SESSIONS:
+            _PREFETCHED_SESSIONS.pop(next(iter(_PREFETCHED_SESSIONS)))
+        _PREFETCHED_SESSIONS[session_id] = session_data
+        # Writes nothing to state so it never conflicts with the classifier branch
+        return {}
 
-    perf_config = performance_config or {
-        "max_execution_time": 30.0,
-        "agent_timeout": 5.0,
-        "checkpoint_interval": 5,
-        "enable_metrics": True,
-        "routing_cache_size": 1000,
-        "error_recovery_enabled": True,
-    }
+    return speculative_prefetch
 
-    router = EnhancedWorkflowRouter(
-        use_case_config=use_case_config,
-        performance_mode=perf_config.get("routing_cache_size", 0) > 0,
-    )
 
-    workflow_builder = WorkflowBuilder(llm_provider=llm_provider)
+def _create_intent_gate_node() -> Callable[[UniversalWorkflowState], Any]:
+    """Create join node that keeps or discards the speculative session prefetch."""
 
-    graph_config = EnterpriseGraphConfig(enable_compliance=True)
-    workflow = EnterpriseStateGraph(UniversalWorkflowState, graph_config)
+    async def intent_gate(state: UniversalWorkflowState) -> dict[str, Any]:
+        session_data = _PREFETCHED_SESSIONS.pop(safe_get_session_id(state), None)
+        context_data = safe_get_context_data(state)
 
-    agents = _get_universal_agent_list(use_case_config)
-    for agent_name in agents:
-        workflow.add_node(
-            agent_name,
-            _create_enhanced_agent_node(agent_name, workflow_builder=workflow_builder),
-        )
+        # Help and greeting turns never reach the orchestrator, so drop the prefetch
+        if session_data is None or context_data.get("message_type") in (
+            _HELP_MESSAGE_TYPES
+        ):
+            return {}
 
-    _add_enhanced_conditional_edges(workflow, router, agents)
+        # The context_data reducer merges this key into the existing context
+        return {"context_data": {"prefetched_session": session_data}}
 
-    entry_point = agents[0] if agents else "email_workflow_orchestrator"
-    workflow.set_entry_point(entry_point)
+    return intent_gate
 
-    if checkpointer is None:
-        if SQLITE_AVAILABLE:
-            enhanced_checkpointer = SqliteSaver.from_conn_string(":memory:")
-        else:
-            enhanced_checkpointer = (
-                SqliteSaver()
-            )  # MemorySaver doesn't use from_conn_string
-    else:
-        enhanced_checkpointer = checkpointer
-    compiled_workflow = workflow.compile(
-        checkpointer=enhanced_checkpointer,
-        interrupt_before=(
-            ["escalation_handler", "human_intervention"] if enable_debug else None
-        ),
-        interrupt_after=["failure_analyst"] if enable_debug else None,
-    )
 
-    return compiled_workflow
+# Agent node maps are built once per mode; node objects hold no per-call state
+_SIMULATION_AGENT_NODES: Mapping[str, Callable] = MappingProxyType(
+    {
+        "batch_requirements_collector": batch_requirements_collector,
+        "strategy_generator": strategy_generator,
+        "strategy_confirmation_handler": strategy_confirmation_handler,
+        "enhanced_email_generator": enhanced_email_generator,
+    }
+)
+_real_agent_nodes: Mapping[str, Callable] | None = None
+_real_agent_nodes_lock = threading.Lock()
 
 
 def _select_agents(
     use_real_agents: bool,
     workflow_builder: WorkflowBuilder,
     llm_config_path: str | None = None,
-) -> dict[str, Callable]:
-    """Select between real and simulated agents with comprehensive real agent support."""
+) -> Mapping[str, Callable]:
+    """Select between real and simulated agents with comprehensive real agent support.
 
-    if use_real_agents:
-        try:
-            from universal_framework.nodes.batch_requirements_collector import (
-                BatchRequirementsCollectorNode,
-            )
-            from universal_framework.nodes.enhanced_email_generator import (
-                EnhancedEmailGeneratorNode,
-            )
-            from universal_framework.nodes.strategy_confirmation_handler import (
-                StrategyConfirmationHandler,
-            )
-            from universal_framework.nodes.strategy_generator_node import (
-                StrategyGeneratorNode,
-            )
+    Real agent nodes are instantiated on first use and shared afterwards. If
+    they cannot be created, the simulation agents are cached in their place.
+    """
+
+    global _real_agent_nodes
+
+    if not use_real_agents:
+        return _SIMULATION_AGENT_NODES
+    if _real_agent_nodes is not None:
+        return _real_agent_nodes
+
+    with _real_agent_nodes_lock:
+        if _real_agent_nodes is None:
+            _real_agent_nodes = _create_real_agent_nodes()
+    return _real_agent_nodes
+
+
+def _create_real_agent_nodes() -> Mapping[str, Callable]:
+    """Instantiate real agent nodes, falling back to simulations on failure."""
+
+    try:
+        from universal_framework.nodes.batch_requirements_collector import (
+            BatchRequirementsCollectorNode,
+        )
+        from universal_framework.nodes.enhanced_email_generator import (
+            EnhancedEmailGeneratorNode,
+        )
+        from universal_framework.nodes.strategy_confirmation_handler import (
+            StrategyConfirmationHandler,
+        )
+        from universal_framework.nodes.strategy_generator_node import (
+            StrategyGeneratorNode,
+        )
 
-            real_nodes = {
+        return MappingProxyType(
+            {
                 "batch_requirements_collector": BatchRequirementsCollectorNode().execute,
                 "strategy_generator": StrategyGeneratorNode().execute,
                 "strategy_confirmation_handler": StrategyConfirmationHandler().execute,
                 "enhanced_email_generator": EnhancedEmailGeneratorNode().execute,
             }
+        )
 
-            return real_nodes
+    except ImportError:
+        # Real agents not available, fall back to mock agents
+        pass
+    except (AttributeError, ModuleNotFoundError, TypeError):
+        # Agent initialization failed, fall back to mock agents
+        pass
 
-        except ImportError:
-            # Real agents not available, fall back to mock agents
-            pass
-        except (AttributeError, ModuleNotFoundError, TypeError):
-            # Agent initialization failed, fall back to mock agents
-            pass
-
-    return {
-        "batch_requirements_collector": batch_requirements_collector,
-        "strategy_generator": strategy_generator,
-        "strategy_confirmation_handler": strategy_confirmation_handler,
-        "enhanced_email_generator": enhanced_email_generator,
-    }
+    return _SIMULATION_AGENT_NODES
 
 
 def _is_real_agent(agent_func: Callable) -> bool:
@@ -633,58 +887,48 @@ def _create_enhanced_agent_node(
     use_real_agents: bool = True,
     workflow_builder: WorkflowBuilder | None = None,
     llm_config_path: str | None = None,
+    agent_semaphore: asyncio.Semaphore | None = None,
 ) -> Callable[[UniversalWorkflowState], UniversalWorkflowState]:
-    """Create enhanced agent node that executes real agents with error recovery."""
+    """Create enhanced agent node that executes real agents with error recovery.
+
+    When ``agent_semaphore`` is given, agent execution waits for a slot so
+    concurrent agents cannot exhaust the Redis pool or LLM rate limits.
+    """
+
+    circuit_breaker = _get_agent_circuit_breaker(agent_name)
+    admission = agent_semaphore or nullcontext()
+    # (async runner, is_real_agent), resolved on first successful lookup
+    resolved: tuple[Callable[..., Any], bool] | None = None
 
     async def enhanced_agent_node(
         state: UniversalWorkflowState,
     ) -> UniversalWorkflowState:
-        import asyncio
-        import time
-
-        from universal_framework.workflow.error_recovery import AgentCircuitBreaker
+        nonlocal resolved
+        start_time = time.perf_counter()
+        # Normalize once so the body can use plain attribute access
+        state = ensure_state_type(state, trusted=True)
+        recovery_attempts = state.recovery_attempts
+        error_recovery_state = state.error_recovery_state
+        context_data = state.context_data
 
         try:
-            from universal_framework.observability.simple_metrics import (
-                measure_agent_execution,
-            )
-        except (
-            ImportError,
-            ModuleNotFoundError,
-        ):  # pragma: no cover - metrics optional
-            from contextlib import (
-                nullcontext as measure_agent_execution,  # type: ignore
-            )
-
-        start_time = time.time()
-        circuit_breaker = AgentCircuitBreaker()
-
-        try:
-            agents = _select_agents(use_real_agents, workflow_builder, llm_config_path)
-            if agent_name not in agents:
-                # Defensive programming for LangGraph state conversion
-                recovery_attempts = (
-                    state.recovery_attempts
-                    if hasattr(state, "recovery_attempts")
-                    else state.get("recovery_attempts", {})
-                )
-                error_recovery_state = (
-                    state.error_recovery_state
-                    if hasattr(state, "error_recovery_state")
-                    else state.get("error_recovery_state", {})
-                )
-                context_data = (
-                    state.context_data
-                    if hasattr(state, "context_data")
-                    else state.get("context_data", {})
+            if resolved is None:
+                agents = _select_agents(
+                    use_real_agents, workflow_builder, llm_config_path
                 )
-
+                agent_func = agents.get(agent_name)
+                if agent_func is not None:
+                    resolved = (
+                        _as_async_agent(agent_func),
+                        _is_real_agent(agent_func),
+                    )
+            if resolved is None:
                 error_ctx = {
                     "error_type": "agent_not_found",
                     "retry_count": recovery_attempts.get(agent_name, 0),
                     "original_error": f"Agent {agent_name} unavailable",
                 }
-                exec_ms = (time.time() - start_time) * 1000
+                exec_ms = (time.perf_counter() - start_time) * 1000
                 return state.copy(
                     update={
                         "error_recovery_state": {
@@ -703,19 +947,12 @@ def _create_enhanced_agent_node(
                     }
                 )
 
-            agent_func = agents[agent_name]
-            is_real_agent = _is_real_agent(agent_func)
-
-            with measure_agent_execution(agent_name, is_real_agent):
-                if asyncio.iscoroutinefunction(agent_func):
-                    result_state = await circuit_breaker.execute_with_fallback(
-                        agent_func,
-                        lambda s=state: s,
-                        state,
-                    )[0]
-                else:
+            run_agent, is_real_agent = resolved
+
+            async with admission:
+                with measure_agent_execution(agent_name, is_real_agent):
                     result_state, _ = await circuit_breaker.execute_with_fallback(
-                        asyncio.to_thread, agent_func, state
+                        run_agent, _return_state_unchanged, state
                     )
 
             if not isinstance(result_state, UniversalWorkflowState):
@@ -723,7 +960,7 @@ def _create_enhanced_agent_node(
                     f"Agent {agent_name} returned invalid state type: {type(result_state)}"
                 )
 
-            exec_ms = (time.time() - start_time) * 1000
+            exec_ms = (time.perf_counter() - start_time) * 1000
             meta = {
                 "agent_name": agent_name,
                 "execution_time_ms": exec_ms,
@@ -735,49 +972,16 @@ def _create_enhanced_agent_node(
             return result_state.copy(
                 update={
                     "context_data": {
-                        **(
-                            result_state.context_data
-                            if hasattr(result_state, "context_data")
-                            else result_state.get("context_data", {})
-                        ),
+                        **result_state.context_data,
                         "last_agent_execution": meta,
                         "agent_execution_failed": False,
                     },
-                    "audit_trail": [
-                        *(
-                            result_state.audit_trail
-                            if hasattr(result_state, "audit_trail")
-                            else result_state.get("audit_trail", [])
-                        ),
-                        meta,
-                    ],
+                    "audit_trail": [*result_state.audit_trail, meta],
                 }
             )
 
         except (AttributeError, KeyError, TypeError, RuntimeError, TimeoutError) as exc:
-            exec_ms = (time.time() - start_time) * 1000
-            # Defensive programming for LangGraph state conversion
-            recovery_attempts = (
-                state.recovery_attempts
-                if hasattr(state, "recovery_attempts")
-                else state.get("recovery_attempts", {})
-            )
-            error_recovery_state = (
-                state.error_recovery_state
-                if hasattr(state, "error_recovery_state")
-                else state.get("error_recovery_state", {})
-            )
-            context_data = (
-                state.context_data
-                if hasattr(state, "context_data")
-                else state.get("context_data", {})
-            )
-            audit_trail = (
-                state.audit_trail
-                if hasattr(state, "audit_trail")
-                else state.get("audit_trail", [])
-            )
-
+            exec_ms = (time.perf_counter() - start_time) * 1000
             error_ctx = {
                 "error_type": "execution_failure",
                 "retry_count": recovery_attempts.get(agent_name, 0),
@@ -803,7 +1007,7 @@ def _create_enhanced_agent_node(
                         "failed_agent": agent_name,
                     },
                     "audit_trail": [
-                        *audit_trail,
+                        *state.audit_trail,
                         {
                             "agent_name": agent_name,
                             "execution_time_ms": exec_ms,
@@ -818,14 +1022,68 @@ def _create_enhanced_agent_node(
     return enhanced_agent_node
 
 
+def _get_agent_circuit_breaker(agent_name: str) -> AgentCircuitBreaker:
+    """Return the process-wide circuit breaker for an agent."""
+
+    with _agent_circuit_breakers_lock:
+        breaker = _AGENT_CIRCUIT_BREAKERS.get(agent_name)
+        if breaker is None:
+            breaker = _AGENT_CIRCUIT_BREAKERS[agent_name] = AgentCircuitBreaker()
+    return breaker
+
+
+def _as_async_agent(agent_func: Callable[..., Any]) -> Callable[..., Any]:
+    """Return ``agent_func`` as a coroutine function.
+
+    Synchronous agents are wrapped to run on the shared executor so they
+    never block the event loop.
+    """
+
+    if asyncio.iscoroutinefunction(agent_func):
+        return agent_func
+
+    async def run_sync_agent(state: UniversalWorkflowState) -> UniversalWorkflowState:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_SYNC_AGENT_EXECUTOR, agent_func, state)
+
+    return run_sync_agent
+
+
+async def _return_state_unchanged(
+    state: UniversalWorkflowState,
+) -> UniversalWorkflowState:
+    """Circuit-breaker fallback that leaves the state as it was."""
+    return state
+
+
+def _add_parallel_fan_out(workflow: EnterpriseStateGraph, agent_name: str) -> bool:
+    """Fan ``agent_name`` out to its independent successors, if it has any.
+
+    The successors run in the same superstep and rejoin at
+    ``parallel_synthesizer``. Returns ``False`` when the agent has no
+    parallel successors and still needs its regular outgoing edge.
+    """
+
+    successors = _PARALLEL_SUCCESSORS.get(agent_name)
+    if not successors:
+        return False
+    for successor in successors:
+        workflow.add_edge(agent_name, successor)
+    workflow.add_edge(list(successors), "parallel_synthesizer")
+    return True
+
+
 def _add_enhanced_conditional_edges(
     workflow: EnterpriseStateGraph,
     router: EnhancedWorkflowRouter,
     universal_agents: list[str],
+    enable_parallel: bool = False,
 ) -> None:
     """Add conditional edges for enhanced workflow."""
 
     for agent_name in universal_agents:
+        if enable_parallel and _add_parallel_fan_out(workflow, agent_name):
+            continue
         routing_function = _create_agent_routing_function(agent_name, router)
         mapping = {node: node for node in router.get_possible_next_nodes(agent_name)}
         mapping[END] = END
@@ -853,12 +1111,8 @@ def _create_workflow_phase_router():
         Must handle all possible states and return valid node names or END.
         """
         try:
-            # Ensure state is proper UniversalWorkflowState type - defensive programming for LangGraph state conversion
-            context_data = (
-                state.context_data
-                if hasattr(state, "context_data")
-                else state.get("context_data", {})
-            )
+            # State may arrive as a model or a dict after LangGraph conversion
+            context_data = as_state_view(state).get("context_data", {})
             if not context_data:
                 # Defensive programming: if state lost type, return END
                 return END
@@ -866,22 +1120,10 @@ def _create_workflow_phase_router():
             routing_info = context_data.get("workflow_orchestration", {})
             next_agent = routing_info.get("next_agent", END)
 
-            # Explicit valid agent list matching graph nodes
-            valid_agents = [
-                "batch_requirements_collector",
-                "strategy_generator",
-                "strategy_confirmation_handler",
-                "enhanced_email_generator",
-            ]
-
-            # Exhaustive routing with proper fallback
-            if next_agent in valid_agents:
+            # Exhaustive routing: "END", END and any unexpected decision all end
+            if next_agent in _ORCHESTRATOR_TARGETS:
                 return next_agent
-            elif next_agent == "END" or next_agent == END:
-                return END
-            else:
-                # Default fallback for any unexpected routing decisions
-                return END
+            return END
 
         except (AttributeError, KeyError, TypeError):
             # Circuit breaker: if routing fails, end workflow safely
@@ -893,28 +1135,22 @@ def _create_workflow_phase_router():
 def _create_quality_validator():
     """Create quality validation agent for parallel processing demo."""
 
-    from universal_framework.contracts.nodes import streamlined_node
+    async def quality_validator(state: UniversalWorkflowState) -> dict[str, Any]:
+        """Validate email quality in parallel.
 
-    @streamlined_node("quality_validator", WorkflowPhase.REVIEW)
-    async def quality_validator(
-        state: UniversalWorkflowState,
-    ) -> UniversalWorkflowState:
-        """Validate email quality in parallel."""
+        Returns only ``validation_results`` so it can run alongside
+        ``delivery_coordinator`` in the same superstep.
+        """
 
-        # Defensive programming for LangGraph state conversion
-        context_data = (
-            state.context_data
-            if hasattr(state, "context_data")
-            else state.get("context_data", {})
-        )
-        generated_email = context_data.get("generated_email", {})
+        view = as_state_view(state)
+        generated_email = (view.get("context_data") or {}).get("generated_email", {})
 
         # Simulate quality validation
         quality_score = 0.9 if generated_email else 0.0
 
-        updates = {
-            "context_data": {
-                **context_data,
+        return {
+            "validation_results": {
+                **(view.get("validation_results") or {}),
                 "quality_validation": {
                     "score": quality_score,
                     "passed": quality_score >= 0.8,
@@ -923,74 +1159,75 @@ def _create_quality_validator():
             }
         }
 
-        return state.copy(update=updates)
-
     return quality_validator
 
 
 def _create_delivery_coordinator():
     """Create delivery coordination agent for parallel processing demo."""
 
-    from universal_framework.contracts.nodes import streamlined_node
+    async def delivery_coordinator(state: UniversalWorkflowState) -> dict[str, Any]:
+        """Coordinate email delivery in parallel.
 
-    @streamlined_node("delivery_coordinator", WorkflowPhase.DELIVERY)
-    async def delivery_coordinator(
-        state: UniversalWorkflowState,
-    ) -> UniversalWorkflowState:
-        """Coordinate email delivery in parallel."""
+        Returns only ``final_outputs`` so it can run alongside
+        ``quality_validator`` in the same superstep.
+        """
 
-        # Defensive programming for LangGraph state conversion
-        context_data = (
-            state.context_data
-            if hasattr(state, "context_data")
-            else state.get("context_data", {})
-        )
-        generated_email = context_data.get("generated_email", {})
+        view = as_state_view(state)
+        generated_email = (view.get("context_data") or {}).get("generated_email", {})
 
         # Simulate delivery preparation
-        delivery_ready = bool(generated_email)
-
-        updates = {
-            "workflow_phase": WorkflowPhase.DELIVERY,
-            "context_data": {
-                **context_data,
+        return {
+            "final_outputs": {
+                **(view.get("final_outputs") or {}),
                 "delivery_status": {
-                    "ready": delivery_ready,
+                    "ready": bool(generated_email),
                     "format": "html",
                     "timestamp": datetime.now().isoformat(),
                 },
-            },
+            }
         }
 
-        return state.copy(update=updates)
-
     return delivery_coordinator
 
 
+def _create_parallel_synthesizer():
+    """Create fan-in node that merges parallel branch results into context."""
+
+    async def parallel_synthesizer(state: UniversalWorkflowState) -> dict[str, Any]:
+        view = as_state_view(state)
+        validation_results = view.get("validation_results") or {}
+        final_outputs = view.get("final_outputs") or {}
+
+        return {
+            "workflow_phase": WorkflowPhase.DELIVERY,
+            "context_data": {
+                "quality_validation": validation_results.get("quality_validation"),
+                "delivery_status": final_outputs.get("delivery_status"),
+            },
+        }
+
+    return parallel_synthesizer
+
+
 def _add_performance_monitoring(
     workflow: CompiledEnterpriseGraph, config: dict[str, Any]
 ) -> CompiledEnterpriseGraph:
     """Add actual performance monitoring to workflow."""
 
-    if not config.get("enable_metrics", False):
+    if not config.get("enable_metrics", False) or simple_metrics is None:
+        # Metrics disabled or module unavailable - graceful degradation
         return workflow
 
     try:
-        from universal_framework.observability.simple_metrics import (
-            get_metrics_summary,
-            record_workflow_phase_transition,
-        )
-
-        get_metrics_summary()
+        simple_metrics.get_metrics_summary()
 
         # Placeholder for future node-wrapping metrics integration
-        record_workflow_phase_transition("init", "init")
-
-        return workflow
+        simple_metrics.record_workflow_phase_transition("init", "init")
+    except AttributeError:
+        # Metrics module lacks the helpers - graceful degradation
+        pass
 
-    except (ImportError, ModuleNotFoundError, AttributeError):
-        # Metrics module unavailable - graceful degradation
-        return workflow
+    return workflow
 
 
 # Utility functions for workflow execution
@@ -1005,11 +1242,7 @@ async def execute_workflow_step(
 
     if config is None:
         # Defensive programming for LangGraph state conversion
-        session_id = (
-            state.session_id
-            if hasattr(state, "session_id")
-            else state.get("session_id", "default")
-        )
+        session_id = as_state_view(state).get("session_id", "default")
         config = RunnableConfig(configurable={"thread_id": session_id})
 
     try:
@@ -1034,63 +1267,35 @@ def validate_workflow_state(state: UniversalWorkflowState) -> dict[str, Any]:
 
     validation_results = {"valid": True, "errors": [], "warnings": []}
 
-    # Basic validation - defensive programming for LangGraph state conversion
-    session_id = (
-        state.session_id
-        if hasattr(state, "session_id")
-        else state.get("session_id", None)
-    )
+    # Basic validation - state may be a model or a dict after LangGraph conversion
+    view = as_state_view(state)
+    session_id = view.get("session_id")
     if not session_id:
         validation_results["errors"].append("Missing session_id")
         validation_results["valid"] = False
 
-    # Check user_id with defensive programming
-    user_id = state.user_id if hasattr(state, "user_id") else state.get("user_id", None)
+    user_id = view.get("user_id")
     if not user_id:
         validation_results["errors"].append("Missing user_id")
         validation_results["valid"] = False
 
-    # Phase-specific validation - defensive programming for workflow_phase
+    # Phase-specific validation; unknown or missing phases use the default
     try:
-        phase = (
-            state.workflow_phase
-            if hasattr(state, "workflow_phase")
-            else state.get("workflow_phase", WorkflowPhase.INITIALIZATION.value)
-        )
-        if isinstance(phase, str):
-            phase = WorkflowPhase(phase)
-    except (AttributeError, ValueError):
-        # If state is dict or invalid phase, use default
-        phase = WorkflowPhase(
-            state.get("workflow_phase", WorkflowPhase.INITIALIZATION.value)
-            if isinstance(state, dict)
-            else WorkflowPhase.INITIALIZATION
-        )
-
-    # Context data access with defensive programming
-    context_data = (
-        state.context_data
-        if hasattr(state, "context_data")
-        else state.get("context_data", {})
-    )
-
-    if phase == WorkflowPhase.STRATEGY_ANALYSIS and not context_data.get(
-        "collected_requirements"
-    ):
-        validation_results["warnings"].append(
-            "No requirements collected for strategy analysis"
+        phase = _PHASE_LOOKUP.get(
+            view.get("workflow_phase"), WorkflowPhase.INITIALIZATION
         )
-
-    elif phase == WorkflowPhase.STRATEGY_CONFIRMATION and not context_data.get(
-        "generated_strategy"
-    ):
-        validation_results["errors"].append("No strategy generated for confirmation")
-        validation_results["valid"] = False
-
-    elif phase == WorkflowPhase.GENERATION and not context_data.get(
-        "approved_strategy"
-    ):
-        validation_results["warnings"].append("No approved strategy for generation")
+    except TypeError:
+        # Unhashable phase value
+        phase = WorkflowPhase.INITIALIZATION
+
+    prerequisite = _PHASE_PREREQUISITES.get(phase)
+    if prerequisite is not None:
+        key, severity, message = prerequisite
+        context_data = view.get("context_data") or {}
+        if not context_data.get(key):
+            validation_results[severity].append(message)
+            if severity == "errors":
+                validation_results["valid"] = False
 
     return validation_results
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -42,6 +43,8 @@ class AgentCircuitBreaker:
             last_failure=None,
             last_success=None,
         )
+        # Monotonic deadline while FAILED; avoids datetime math on every call
+        self._skip_until: float | None = None
 
     async def execute_with_fallback(
         self,
@@ -70,14 +73,11 @@ class AgentCircuitBreaker:
         if self.state.status == AgentStatus.HEALTHY:
             return False
         if self.state.status == AgentStatus.FAILED:
-            if (
-                self.state.last_failure
-                and datetime.now() - self.state.last_failure > self.recovery_timeout
-            ):
-                self.state.status = AgentStatus.DEGRADED
-                self.state.failure_count = 0
-                return False
-            return True
+            if self._skip_until is None or time.monotonic() < self._skip_until:
+                return True
+            self.state.status = AgentStatus.DEGRADED
+            self.state.failure_count = 0
+            self._skip_until = None
         return False
 
     def _record_success(self) -> None:
@@ -91,5 +91,8 @@ class AgentCircuitBreaker:
         self.state.failure_count += 1
         if self.state.failure_count >= self.failure_threshold:
             self.state.status = AgentStatus.FAILED
+            self._skip_until = (
+                time.monotonic() + self.recovery_timeout.total_seconds()
+            )
         elif self.state.status == AgentStatus.HEALTHY:
             self.state.status = AgentStatus.DEGRADED
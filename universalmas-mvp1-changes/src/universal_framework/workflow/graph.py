@@ -4,11 +4,24 @@ LangGraph Studio Workflow Entry Point
 This module provides the graph creation function for LangGraph Studio.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from langgraph.graph import StateGraph
 
-from universal_framework.workflow.builder import WorkflowBuilder
+from universal_framework.workflow.builder import create_streamlined_workflow
+
+# Further increased limit for production robustness
+DEFAULT_RECURSION_LIMIT = 200
+
+
+@lru_cache(maxsize=8)
+def _compile_workflow_graph(recursion_limit: int) -> StateGraph:
+    """Build and compile the workflow once per recursion limit."""
+
+    # In-memory checkpointing, no Redis
+    workflow = create_streamlined_workflow(checkpointer=None)
+    return workflow.with_config(recursion_limit=recursion_limit)
 
 
 def create_workflow_graph() -> StateGraph:
@@ -16,21 +29,13 @@ def create_workflow_graph() -> StateGraph:
     Create the workflow graph for LangGraph Studio.
 
     This function is referenced in langgraph.json and provides
-    the entry point for Studio visualization and debugging.
+    the entry point for Studio visualization and debugging. The compiled
+    graph is cached, so repeated calls return the same instance.
 
     Returns:
         StateGraph: Compiled workflow graph
     """
-    # Use our existing workflow builder
-    builder = WorkflowBuilder()
-
-    # Build the workflow with in-memory checkpointing
-    workflow = builder.build_workflow(
-        checkpointer=None,  # No Redis - use in-memory
-        recursion_limit=200,  # Further increased limit for production robustness
-    )
-
-    return workflow
+    return _compile_workflow_graph(DEFAULT_RECURSION_LIMIT)
 
 
 def create_workflow_with_config(config: dict[str, Any] = None) -> StateGraph:
@@ -41,20 +46,12 @@ def create_workflow_with_config(config: dict[str, Any] = None) -> StateGraph:
         config: Optional configuration dictionary
 
     Returns:
-        StateGraph: Configured workflow graph
+        StateGraph: Configured workflow graph, shared by calls with the
+        same configuration
     """
     if config is None:
         config = {}
 
-    builder = WorkflowBuilder()
-
-    # Apply any custom configuration
-    recursion_limit = config.get(
-        "recursion_limit", 200
-    )  # Further increased default limit
-
-    workflow = builder.build_workflow(
-        checkpointer=None, recursion_limit=recursion_limit
-    )
+    recursion_limit = config.get("recursion_limit", DEFAULT_RECURSION_LIMIT)
 
-    return workflow
+    return _compile_workflow_graph(recursion_limit)
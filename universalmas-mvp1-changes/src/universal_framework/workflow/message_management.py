@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Protocol
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
@@ -20,6 +22,56 @@ from universal_framework.workflow.orchestrator import (
 )
 
 
+# Keywords per conversation theme, checked in order by SummarizedFilter
+_THEME_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "email": ("email", "message", "communication", "send", "compose"),
+        "strategy": ("strategy", "plan", "approach", "method", "way"),
+        "requirements": ("need", "require", "want", "should", "must"),
+        "analysis": ("analyze", "review", "check", "examine", "study"),
+        "generation": ("create", "generate", "make", "build", "produce"),
+        "professional": ("professional", "business", "formal", "corporate"),
+        "urgent": ("urgent", "asap", "immediately", "quickly", "fast"),
+    }
+)
+
+_MAX_THEMES = 5
+
+# Role checks in precedence order; subclasses resolve to their first match
+_ROLE_BASES: tuple[tuple[type[BaseMessage], str], ...] = (
+    (HumanMessage, "human"),
+    (AIMessage, "assistant"),
+    (AgentMessage, "agent"),
+)
+# Exact message type -> role, filled in as new subclasses are seen
+_ROLE_BY_TYPE: dict[type, str] = {cls: role for cls, role in _ROLE_BASES}
+
+
+def _message_role(msg: BaseMessage) -> str:
+    """Return the filter role of ``msg`` with one dict lookup per known type."""
+    msg_type = type(msg)
+    role = _ROLE_BY_TYPE.get(msg_type)
+    if role is None:
+        role = next(
+            (role for cls, role in _ROLE_BASES if issubclass(msg_type, cls)),
+            "other",
+        )
+        _ROLE_BY_TYPE[msg_type] = role
+    return role
+
+
+def _resolve_phase(
+    state: UniversalWorkflowState | Mapping[str, Any],
+) -> WorkflowPhase:
+    """Return the workflow phase of model or dict state."""
+    phase = getattr(state, "workflow_phase", None)
+    if phase is None:
+        phase = WorkflowPhase(
+            state.get("workflow_phase", WorkflowPhase.INITIALIZATION.value)
+        )
+    return phase
+
+
 class MessageHistoryMode(Enum):
     """Supported message history strategies."""
 
@@ -54,7 +106,7 @@ class LastMessageFilter:
     def filter_messages(
         self, messages: list[BaseMessage], state: UniversalWorkflowState
     ) -> list[BaseMessage]:
-        return messages[-1:] if messages else []
+        return messages if len(messages) <= 1 else messages[-1:]
 
 
 class PhaseScopedFilter:
@@ -63,24 +115,28 @@ class PhaseScopedFilter:
     def filter_messages(
         self, messages: list[BaseMessage], state: UniversalWorkflowState
     ) -> list[BaseMessage]:
-        # Defensive programming for workflow_phase access
-        try:
-            current_phase = state.workflow_phase
-        except AttributeError:
-            current_phase = WorkflowPhase(
-                state.get("workflow_phase", WorkflowPhase.INITIALIZATION.value)
-            )
+        current_phase = _resolve_phase(state)
 
+        # AgentMessage has no subclasses, so an exact type check skips the MRO
+        # walk. Phases stay compared with == because they may be stored raw.
+        agent_message = AgentMessage
         return [
             m
             for m in messages
-            if isinstance(m, AgentMessage) and m.phase == current_phase
+            if type(m) is agent_message and m.phase == current_phase
         ]
 
 
 class OptimizedSlidingWindowFilter:
     """Performance-optimized sliding window with Redis integration hooks."""
 
+    __slots__ = (
+        "window_size",
+        "redis_coordinator",
+        "_small_window_threshold",
+        "_context_search_limit",
+    )
+
     def __init__(self, window_size: int = 10, redis_coordinator: Any = None) -> None:
         """Initialize optimized sliding window filter."""
         if window_size <= 0:
@@ -102,12 +158,21 @@ class OptimizedSlidingWindowFilter:
             return messages
 
         start_index = len(messages) - self.window_size
-        recent_messages = messages[start_index:]
-
-        if not self._has_human_message(recent_messages) and start_index > 0:
+        context_message = None
+        # The human check only reads the tail, which the window shares
+        if not self._has_human_message(messages) and start_index > 0:
             context_message = self._find_recent_human_context(messages, start_index)
-            if context_message:
-                recent_messages.insert(0, context_message)
+
+        if context_message:
+            # Slice one extra slot and overwrite it rather than insert(0, ...)
+            recent_messages = messages[start_index - 1 :]
+            recent_messages[0] = context_message
+        else:
+            recent_messages = messages[start_index:]
+
+        # Without a coordinator both hooks are no-ops; skip building the payload
+        if not self.redis_coordinator:
+            return recent_messages
 
         coordination = self._coordinate_with_redis(state)
         return self._apply_distributed_optimizations(recent_messages, coordination)
@@ -122,21 +187,16 @@ class OptimizedSlidingWindowFilter:
     def _find_recent_human_context(
         self, messages: list[BaseMessage], before_index: int
     ) -> BaseMessage | None:
-        """Binary search for most recent HumanMessage before index."""
-        search_start = max(0, before_index - self._context_search_limit)
-        search_end = before_index - 1
-
-        left, right = search_start, search_end
-        result_index = -1
-        while left <= right:
-            mid = (left + right) // 2
-            if isinstance(messages[mid], HumanMessage):
-                result_index = mid
-                left = mid + 1
-            else:
-                right = mid - 1
+        """Return the most recent HumanMessage before index.
 
-        return messages[result_index] if result_index != -1 else None
+        Scans backwards and stops at the first match; human turns are not
+        ordered by type, so a bisection over positions can skip them.
+        """
+        search_start = max(0, before_index - self._context_search_limit)
+        for i in range(before_index - 1, search_start - 1, -1):
+            if isinstance(messages[i], HumanMessage):
+                return messages[i]
+        return None
 
     def _coordinate_with_redis(
         self, state: UniversalWorkflowState
@@ -178,27 +238,30 @@ class OptimizedSlidingWindowFilter:
 class RoleFilteredFilter:
     """Return messages from specific roles."""
 
+    __slots__ = ("included_roles", "_included_set")
+
     def __init__(self, included_roles: list[str] | None = None) -> None:
         self.included_roles = included_roles or ["human", "assistant", "agent"]
+        self._included_set = frozenset(self.included_roles)
 
     def filter_messages(
         self, messages: list[BaseMessage], state: UniversalWorkflowState
     ) -> list[BaseMessage]:
-        def _role(msg: BaseMessage) -> str:
-            if isinstance(msg, HumanMessage):
-                return "human"
-            if isinstance(msg, AIMessage):
-                return "assistant"
-            if isinstance(msg, AgentMessage):
-                return "agent"
-            return "other"
-
-        return [m for m in messages if _role(m) in self.included_roles]
+        included = self._included_set
+        return [m for m in messages if _message_role(m) in included]
 
 
 class SummarizedFilter:
     """Summarize old messages to reduce memory usage while preserving conversation context."""
 
+    __slots__ = ("summary_threshold", "keep_recent")
+
+    # Constant metadata entries; each summary copies this and adds the rest
+    _METADATA_TEMPLATE: dict[str, Any] = {
+        "type": "conversation_summary",
+        "summary_strategy": "intelligent_threshold",
+    }
+
     def __init__(self, summary_threshold: int = 20, keep_recent: int = 5) -> None:
         """Initialize conversation summarization filter."""
         if summary_threshold < keep_recent:
@@ -225,20 +288,16 @@ class SummarizedFilter:
             messages_to_summarize, state
         )
 
+        original_count = len(messages_to_summarize)
+        metadata = self._METADATA_TEMPLATE.copy()
+        metadata["original_count"] = original_count
+        metadata["summary_timestamp"] = datetime.now().isoformat()
+        metadata["workflow_phase"] = _resolve_phase(state).value
+        metadata["session_id"] = getattr(state, "session_id", "unknown")
+
         summary_message: BaseMessage = AIMessage(
-            content=f"[CONVERSATION SUMMARY: {len(messages_to_summarize)} messages] {summary_content}",
-            metadata={
-                "type": "conversation_summary",
-                "original_count": len(messages_to_summarize),
-                "summary_timestamp": datetime.now().isoformat(),
-                "summary_strategy": "intelligent_threshold",
-                "workflow_phase": (
-                    state.workflow_phase.value
-                    if hasattr(state, "workflow_phase")
-                    else state.get("workflow_phase", WorkflowPhase.INITIALIZATION.value)
-                ),
-                "session_id": getattr(state, "session_id", "unknown"),
-            },
+            content=f"[CONVERSATION SUMMARY: {original_count} messages] {summary_content}",
+            metadata=metadata,
         )
 
         return [summary_message] + recent_messages
@@ -254,31 +313,23 @@ class SummarizedFilter:
             msg.content for msg in messages if isinstance(msg, HumanMessage)
         ]
 
-        agent_messages: list[str] = []
-        for msg in messages:
-            if hasattr(msg, "agent_name"):
-                agent_name = getattr(msg, "agent_name", "Agent")
-                content_str = msg.content
-                content_preview = (
-                    content_str[:100] + "..." if len(content_str) > 100 else content_str
-                )
-                agent_messages.append(f"{agent_name}: {content_preview}")
-            elif isinstance(msg, AIMessage):
-                content_str = msg.content
-                content_preview = (
-                    content_str[:100] + "..." if len(content_str) > 100 else content_str
-                )
-                agent_messages.append(f"Assistant: {content_preview}")
+        # Only the count of agent responses reaches the summary
+        agent_response_count = sum(
+            1
+            for msg in messages
+            if hasattr(msg, "agent_name") or isinstance(msg, AIMessage)
+        )
 
         workflow_phases = self._extract_workflow_phases(messages)
         key_themes = self._extract_conversation_themes(human_messages)
 
         summary_parts: list[str] = []
+        write = summary_parts.append
 
         if human_messages:
-            summary_parts.append(f"User interactions: {len(human_messages)}")
+            write(f"User interactions: {len(human_messages)}")
             if key_themes:
-                summary_parts.append(f"Key topics: {', '.join(key_themes[:3])}")
+                write(f"Key topics: {', '.join(key_themes[:3])}")
             if len(human_messages) >= 2:
                 first_input = (
                     human_messages[0][:80] + "..."
@@ -290,23 +341,23 @@ class SummarizedFilter:
                     if len(human_messages[-1]) > 80
                     else human_messages[-1]
                 )
-                summary_parts.append(f"Initial request: '{first_input}'")
-                summary_parts.append(f"Latest input: '{last_input}'")
+                write(f"Initial request: '{first_input}'")
+                write(f"Latest input: '{last_input}'")
             elif len(human_messages) == 1:
                 single_input = (
                     human_messages[0][:120] + "..."
                     if len(human_messages[0]) > 120
                     else human_messages[0]
                 )
-                summary_parts.append(f"User request: '{single_input}'")
+                write(f"User request: '{single_input}'")
 
-        if agent_messages:
-            summary_parts.append(f"Agent responses: {len(agent_messages)}")
+        if agent_response_count:
+            write(f"Agent responses: {agent_response_count}")
 
         if workflow_phases:
-            summary_parts.append(f"Workflow phases: {' → '.join(workflow_phases)}")
+            write(f"Workflow phases: {' → '.join(workflow_phases)}")
 
-        summary_parts.append(f"Message span: {len(messages)} messages")
+        write(f"Message span: {len(messages)} messages")
 
         return ". ".join(summary_parts)
 
@@ -327,34 +378,58 @@ class SummarizedFilter:
         if not human_messages:
             return []
 
-        theme_keywords: dict[str, list[str]] = {
-            "email": ["email", "message", "communication", "send", "compose"],
-            "strategy": ["strategy", "plan", "approach", "method", "way"],
-            "requirements": ["need", "require", "want", "should", "must"],
-            "analysis": ["analyze", "review", "check", "examine", "study"],
-            "generation": ["create", "generate", "make", "build", "produce"],
-            "professional": [
-                "professional",
-                "business",
-                "formal",
-                "corporate",
-            ],
-            "urgent": ["urgent", "asap", "immediately", "quickly", "fast"],
-        }
-
         themes: list[str] = []
         combined_text = " ".join(human_messages).lower()
 
-        for theme, keywords in theme_keywords.items():
+        for theme, keywords in _THEME_KEYWORDS.items():
             if any(keyword in combined_text for keyword in keywords):
                 themes.append(theme)
+                # Only the first five themes are reported, so stop scanning
+                if len(themes) == _MAX_THEMES:
+                    break
+
+        return themes
+
+
+def _new_filter(mode: MessageHistoryMode, kwargs: dict[str, Any]) -> MessageFilter:
+    """Create appropriate filter based on mode using modern Python patterns."""
+    match mode:
+        case MessageHistoryMode.FULL_HISTORY:
+            return FullHistoryFilter()
+        case MessageHistoryMode.LAST_MESSAGE:
+            return LastMessageFilter()
+        case MessageHistoryMode.PHASE_SCOPED:
+            return PhaseScopedFilter()
+        case MessageHistoryMode.SLIDING_WINDOW:
+            window_size = kwargs.get("window_size", 10)
+            redis_coordinator = kwargs.get("redis_coordinator")
+            return OptimizedSlidingWindowFilter(window_size, redis_coordinator)
+        case MessageHistoryMode.ROLE_FILTERED:
+            included_roles = kwargs.get(
+                "included_roles", ["human", "assistant", "agent"]
+            )
+            return RoleFilteredFilter(included_roles)
+        case MessageHistoryMode.SUMMARIZED:
+            summary_threshold = kwargs.get("summary_threshold", 20)
+            keep_recent = kwargs.get("keep_recent", 5)
+            return SummarizedFilter(summary_threshold, keep_recent)
+        case _:
+            return FullHistoryFilter()
+
 
-        return themes[:5]
+@lru_cache(maxsize=64)
+def _shared_filter(
+    mode: MessageHistoryMode, options: tuple[tuple[str, Any], ...]
+) -> MessageFilter:
+    """Return one filter per configuration; filters keep no per-call state."""
+    return _new_filter(mode, dict(options))
 
 
 class MessageHistoryManager:
     """Manage message history based on filtering strategy."""
 
+    __slots__ = ("mode", "filter")
+
     def __init__(
         self,
         mode: MessageHistoryMode = MessageHistoryMode.FULL_HISTORY,
@@ -370,36 +445,23 @@ class MessageHistoryManager:
         custom_filter: MessageFilter | None,
         **kwargs: Any,
     ) -> MessageFilter:
-        """Create appropriate filter based on mode using modern Python patterns."""
+        """Create appropriate filter based on mode, sharing identical configs."""
         if custom_filter:
             return custom_filter
 
-        match mode:
-            case MessageHistoryMode.FULL_HISTORY:
-                return FullHistoryFilter()
-            case MessageHistoryMode.LAST_MESSAGE:
-                return LastMessageFilter()
-            case MessageHistoryMode.PHASE_SCOPED:
-                return PhaseScopedFilter()
-            case MessageHistoryMode.SLIDING_WINDOW:
-                window_size = kwargs.get("window_size", 10)
-                redis_coordinator = kwargs.get("redis_coordinator")
-                return OptimizedSlidingWindowFilter(window_size, redis_coordinator)
-            case MessageHistoryMode.ROLE_FILTERED:
-                included_roles = kwargs.get(
-                    "included_roles", ["human", "assistant", "agent"]
-                )
-                return RoleFilteredFilter(included_roles)
-            case MessageHistoryMode.SUMMARIZED:
-                summary_threshold = kwargs.get("summary_threshold", 20)
-                keep_recent = kwargs.get("keep_recent", 5)
-                return SummarizedFilter(summary_threshold, keep_recent)
-            case _:
-                return FullHistoryFilter()
+        try:
+            return _shared_filter(mode, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable options, such as an included_roles list, skip the cache
+            return _new_filter(mode, kwargs)
 
     def process_messages(self, state: UniversalWorkflowState) -> UniversalWorkflowState:
         """Return new state with filtered messages."""
-        filtered = self.filter.filter_messages(state.messages, state)
+        messages = state.messages
+        filtered = self.filter.filter_messages(messages, state)
+        # Filters hand back the input list when nothing was dropped
+        if filtered is messages:
+            return state
         return state.copy(update={"messages": filtered})
 
 
@@ -439,21 +501,24 @@ def benchmark_sliding_window_performance(
 
     results: dict[str, float] = {}
     filter_instance = OptimizedSlidingWindowFilter(window_size=20)
+    mock_state = UniversalWorkflowState(
+        session_id="benchmark",
+        user_id="test",
+        auth_token="benchmark_token",
+    )
 
-    for count in message_counts:
-        test_messages = [
-            (
-                HumanMessage(content=f"Message {i}")
-                if i % 5 == 0
-                else AIMessage(content=f"Response {i}")
-            )
-            for i in range(count)
-        ]
-        mock_state = UniversalWorkflowState(
-            session_id="benchmark",
-            user_id="test",
-            auth_token="benchmark_token",
+    # Build the largest history once; smaller runs use a prefix of it
+    message_pool = [
+        (
+            HumanMessage(content=f"Message {i}")
+            if i % 5 == 0
+            else AIMessage(content=f"Response {i}")
         )
+        for i in range(max(message_counts, default=0))
+    ]
+
+    for count in message_counts:
+        test_messages = message_pool[:count]
 
         start = time.perf_counter()
         for _ in range(10):
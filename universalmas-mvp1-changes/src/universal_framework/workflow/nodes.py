@@ -1,5 +1,6 @@
 """Email workflow nodes implementing multi-agent orchestration patterns."""
 
+import time
 from datetime import datetime
 
 from universal_framework.contracts.messages import create_agent_message
@@ -19,6 +20,7 @@ from universal_framework.nodes.enhanced_email_generator import (
 from universal_framework.nodes.strategy_confirmation_handler import (
     StrategyConfirmationHandler,
 )
+from universal_framework.utils.state_access import as_state_view
 
 
 @streamlined_node("batch_requirements_collector", WorkflowPhase.BATCH_DISCOVERY)
@@ -45,21 +47,18 @@ async def batch_requirements_collector(
 @streamlined_node("strategy_generator", WorkflowPhase.STRATEGY_ANALYSIS)
 async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflowState:
     """Real strategy generator using StrategyGenerator with enhanced state management."""
-    start_time = datetime.now()
+    start_time = time.perf_counter()
+    view = as_state_view(state)
 
     # Validate requirements before strategy generation
-    requirements_data = (
-        state.context_data
-        if hasattr(state, "context_data")
-        else state.get("context_data", {})
-    ).get("collected_requirements")
+    requirements_data = view.get("context_data", {}).get("collected_requirements")
     if not requirements_data and not state.email_requirements:
         error_audit = {
             "timestamp": datetime.now().isoformat(),
             "node": "strategy_generator",
             "action": "generation_failed",
             "error": "missing_requirements",
-            "execution_time_ms": (datetime.now() - start_time).total_seconds() * 1000,
+            "execution_time_ms": (time.perf_counter() - start_time) * 1000,
         }
 
         msg = create_agent_message(
@@ -73,36 +72,20 @@ async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflow
         return state.copy(
             update={
                 "messages": [
-                    *(
-                        state.messages
-                        if hasattr(state, "messages")
-                        else state.get("messages", [])
-                    ),
+                    *view.get("messages", []),
                     msg,
                 ],
                 "workflow_phase": WorkflowPhase.BATCH_DISCOVERY,
                 "component_status": {
-                    **(
-                        state.component_status
-                        if hasattr(state, "component_status")
-                        else state.get("component_status", {})
-                    ),
+                    **view.get("component_status", {}),
                     "strategy_generator": "failed",
                 },
                 "audit_trail": [
-                    *(
-                        state.audit_trail
-                        if hasattr(state, "audit_trail")
-                        else state.get("audit_trail", [])
-                    ),
+                    *view.get("audit_trail", []),
                     error_audit,
                 ],
                 "context_data": {
-                    **(
-                        state.context_data
-                        if hasattr(state, "context_data")
-                        else state.get("context_data", {})
-                    ),
+                    **view.get("context_data", {}),
                     "last_active_agent": "strategy_generator",
                     "error_message": "Missing requirements for strategy generation",
                 },
@@ -113,19 +96,15 @@ async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflow
         # Ensure state has EmailRequirements - create from context if needed
         if not state.email_requirements and requirements_data:
             # Convert legacy requirements format to EmailRequirements
+            audience = requirements_data.get("audience", "team")
+            key_messages = requirements_data.get("key_messages", "Key information")
             email_requirements = EmailRequirements(
                 purpose=requirements_data.get("purpose", "General communication"),
                 email_type="announcement",  # Default type
-                audience=(
-                    requirements_data.get("audience", ["team"])
-                    if isinstance(requirements_data.get("audience"), list)
-                    else [requirements_data.get("audience", "team")]
-                ),
+                audience=audience if isinstance(audience, list) else [audience],
                 tone=requirements_data.get("tone", "professional"),
                 key_messages=(
-                    requirements_data.get("key_messages", ["Key information"])
-                    if isinstance(requirements_data.get("key_messages"), list)
-                    else [requirements_data.get("key_messages", "Key information")]
+                    key_messages if isinstance(key_messages, list) else [key_messages]
                 ),
                 completeness_score=requirements_data.get("completeness_score", 0.8),
             )
@@ -134,25 +113,27 @@ async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflow
         # Use StrategyGenerator for real AI-powered strategy generation
         generator = StrategyGenerationAgent()
         result_state = await generator.execute(state)
+        result_view = as_state_view(result_state)
+
+        execution_time = time.perf_counter() - start_time
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        strategy = result_state.email_strategy
+        if strategy:
+            # Serialized once; the message data and context_data share this dict
+            strategy_dump = strategy.model_dump()
+            confidence = strategy.confidence_score
+            approach = strategy.overall_approach
+        else:
+            strategy_dump, confidence, approach = {}, 0.0, "unknown"
 
         # Create audit entry for enterprise compliance
         success_audit = {
             "timestamp": datetime.now().isoformat(),
             "node": "strategy_generator",
             "action": "strategy_generated",
-            "strategy_confidence": (
-                result_state.email_strategy.confidence_score
-                if result_state.email_strategy
-                else 0.0
-            ),
+            "strategy_confidence": confidence,
             "execution_time_ms": execution_time * 1000,
-            "approach": (
-                result_state.email_strategy.overall_approach
-                if result_state.email_strategy
-                else "unknown"
-            ),
+            "approach": approach,
         }
 
         response_message = create_agent_message(
@@ -160,72 +141,40 @@ async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflow
             "email_workflow_orchestrator",
             "Strategy generation complete",
             WorkflowPhase.STRATEGY_ANALYSIS,
-            data=(
-                result_state.email_strategy.model_dump()
-                if result_state.email_strategy
-                else {}
-            ),
+            data=strategy_dump,
         )
 
         # Enhanced state update with component tracking
         updates = {
             "workflow_phase": WorkflowPhase.STRATEGY_CONFIRMATION,
             "messages": [
-                *(
-                    result_state.messages
-                    if hasattr(result_state, "messages")
-                    else result_state.get("messages", [])
-                ),
+                *result_view.get("messages", []),
                 response_message,
             ],
             "component_outputs": {
-                **(
-                    result_state.component_outputs
-                    if hasattr(result_state, "component_outputs")
-                    else result_state.get("component_outputs", {})
-                ),
-                "strategy_generator": result_state.email_strategy,
+                **result_view.get("component_outputs", {}),
+                "strategy_generator": strategy,
             },
             "component_status": {
-                **(
-                    result_state.component_status
-                    if hasattr(result_state, "component_status")
-                    else result_state.get("component_status", {})
-                ),
+                **result_view.get("component_status", {}),
                 "strategy_generator": "completed",
             },
             "audit_trail": [
-                *(
-                    result_state.audit_trail
-                    if hasattr(result_state, "audit_trail")
-                    else result_state.get("audit_trail", [])
-                ),
+                *result_view.get("audit_trail", []),
                 success_audit,
             ],
             "context_data": {
-                **(
-                    result_state.context_data
-                    if hasattr(result_state, "context_data")
-                    else result_state.get("context_data", {})
-                ),
-                "strategy_confidence": (
-                    result_state.email_strategy.confidence_score
-                    if result_state.email_strategy
-                    else 0.0
-                ),
+                **result_view.get("context_data", {}),
+                "strategy_confidence": confidence,
                 "last_active_agent": "strategy_generator",
-                "generated_strategy": (
-                    result_state.email_strategy.model_dump()
-                    if result_state.email_strategy
-                    else {}
-                ),
+                "generated_strategy": strategy_dump,
             },
         }
 
         return result_state.copy(update=updates)
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         error_msg = f"Strategy generation failed: {e}"
 
         error_audit = {
@@ -247,35 +196,19 @@ async def strategy_generator(state: UniversalWorkflowState) -> UniversalWorkflow
         return state.copy(
             update={
                 "messages": [
-                    *(
-                        state.messages
-                        if hasattr(state, "messages")
-                        else state.get("messages", [])
-                    ),
+                    *view.get("messages", []),
                     msg,
                 ],
                 "component_status": {
-                    **(
-                        state.component_status
-                        if hasattr(state, "component_status")
-                        else state.get("component_status", {})
-                    ),
+                    **view.get("component_status", {}),
                     "strategy_generator": "failed",
                 },
                 "audit_trail": [
-                    *(
-                        state.audit_trail
-                        if hasattr(state, "audit_trail")
-                        else state.get("audit_trail", [])
-                    ),
+                    *view.get("audit_trail", []),
                     error_audit,
                 ],
                 "context_data": {
-                    **(
-                        state.context_data
-                        if hasattr(state, "context_data")
-                        else state.get("context_data", {})
-                    ),
+                    **view.get("context_data", {}),
                     "error_message": error_msg,
                     "last_active_agent": "strategy_generator",
                 },
@@ -291,40 +224,24 @@ async def strategy_confirmation_handler(
     handler = StrategyConfirmationHandler()
     result_state = await handler.execute(state)
 
+    view = as_state_view(result_state)
+    approved = view.get("context_data", {}).get("strategy_approved")
+
+    # Add component tracking
+    updates = {
+        "component_status": {
+            **view.get("component_status", {}),
+            "strategy_confirmation_handler": "completed" if approved else "pending",
+        }
+    }
+
     # Ensure strategy is marked as confirmed if approved
-    if result_state.email_strategy and (
-        result_state.context_data
-        if hasattr(result_state, "context_data")
-        else result_state.get("context_data", {})
-    ).get("strategy_approved"):
-        confirmed_strategy = result_state.email_strategy.model_copy(
+    if result_state.email_strategy and approved:
+        updates["email_strategy"] = result_state.email_strategy.model_copy(
             update={"is_confirmed": True}
         )
-        result_state = result_state.copy(update={"email_strategy": confirmed_strategy})
-
-    # Add component tracking
-    component_status = (
-        "completed"
-        if (
-            result_state.context_data
-            if hasattr(result_state, "context_data")
-            else result_state.get("context_data", {})
-        ).get("strategy_approved")
-        else "pending"
-    )
 
-    return result_state.copy(
-        update={
-            "component_status": {
-                **(
-                    result_state.component_status
-                    if hasattr(result_state, "component_status")
-                    else result_state.get("component_status", {})
-                ),
-                "strategy_confirmation_handler": component_status,
-            }
-        }
-    )
+    return result_state.copy(update=updates)
 
 
 # NOTE: enhanced_email_generator is imported from nodes package
@@ -1,13 +1,16 @@
 """Email workflow orchestrator implementing LangGraph hierarchical patterns."""
 
-from collections.abc import Awaitable, Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+from langchain_core.messages import HumanMessage
+
 from universal_framework.contracts.messages import (
-    AgentMessage,
     create_agent_message,
-    extract_agent_messages,
+    readdress_agent_message,
 )
 from universal_framework.contracts.nodes import streamlined_node
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
@@ -18,6 +21,14 @@ from universal_framework.security.session_validator import (
     SessionValidator,
 )
 from universal_framework.utils.session_logging import SessionFlowLogger
+from universal_framework.utils.state_access import (
+    safe_get,
+    safe_get_context_data,
+    safe_get_messages,
+    safe_get_phase,
+    safe_get_session_id,
+    safe_get_user_id,
+)
 from universal_framework.workflow.routing import (
     EnhancedWorkflowRouter,
     RoutingDecision,
@@ -25,6 +36,32 @@ from universal_framework.workflow.routing import (
 
 logger = UniversalFrameworkLogger("orchestrator")
 
+# Phase entered when routing advances to each agent
+_AGENT_PHASE_MAP: Mapping[str, WorkflowPhase] = MappingProxyType(
+    {
+        "batch_requirements_collector": WorkflowPhase.BATCH_DISCOVERY,
+        "strategy_generator": WorkflowPhase.STRATEGY_ANALYSIS,
+        "strategy_confirmation_handler": WorkflowPhase.STRATEGY_CONFIRMATION,
+        "enhanced_email_generator": WorkflowPhase.GENERATION,
+    }
+)
+
+# Plain lookup for phase strings; cheaper than the Enum.value descriptor
+_PHASE_VALUE: Mapping[WorkflowPhase, str] = MappingProxyType(
+    {phase: phase.value for phase in WorkflowPhase}
+)
+
+# Copied for each routing message instead of building a new message model
+_ROUTING_MESSAGE_TEMPLATE = create_agent_message(
+    "email_workflow_orchestrator",
+    "unrouted",
+    "unrouted",
+    WorkflowPhase.INITIALIZATION,
+)
+
+# Sessions whose last phase is remembered; the least recently seen is dropped
+_MAX_TRACKED_SESSIONS = 10000
+
 
 def create_email_workflow_orchestrator(
     available_agents: list[str],
@@ -32,16 +69,13 @@ def create_email_workflow_orchestrator(
 ) -> Callable[[UniversalWorkflowState], Awaitable[UniversalWorkflowState]]:
     """Create workflow orchestrator for email coordination with enhanced error handling."""
 
-    # Import dependencies - these should be available in the production environment
-
     router = EnhancedWorkflowRouter()
     validator = SessionValidator()
     if session_storage:
         validator.set_session_storage(session_storage)
     session_logger = SessionFlowLogger()
 
-    session_phase_tracker: dict[str, WorkflowPhase] = {}
-    cleanup_counter = 0
+    session_phase_tracker: OrderedDict[str, WorkflowPhase] = OrderedDict()
 
     @streamlined_node("email_workflow_orchestrator", WorkflowPhase.INITIALIZATION)
     async def email_workflow_orchestrator(
@@ -49,92 +83,6 @@ def create_email_workflow_orchestrator(
     ) -> UniversalWorkflowState:
         """Coordinate email generation workflow with multi-agent patterns."""
 
-        nonlocal cleanup_counter
-
-        # Use defensive state access utilities for LangGraph state conversion
-        # Always define fallback functions first
-        def safe_get_fallback(state, key, expected_type=None, default=None):
-            """Defensive generic state access."""
-            try:
-                value = getattr(state, key)
-            except (AttributeError, TypeError):
-                if isinstance(state, dict):
-                    value = state.get(key, default)
-                else:
-                    value = default
-
-            if value is None:
-                return default
-
-            if expected_type and callable(expected_type):
-                try:
-                    return expected_type(value)
-                except (ValueError, TypeError):
-                    return default
-
-            return value
-
-        try:
-            from universal_framework.utils.state_access import (
-                safe_get,
-                safe_get_context_data,
-                safe_get_messages,
-                safe_get_phase,
-                safe_get_session_id,
-                safe_get_user_id,
-            )
-        except ImportError as e:
-            logger.error(f"Failed to import state_access utilities: {e}")
-
-            # Use fallback implementations for defensive programming
-            def safe_get_session_id(state):
-                """Defensive session ID extraction for both Pydantic and dict states."""
-                try:
-                    return state.session_id
-                except AttributeError:
-                    return state.get("session_id", "unknown")
-
-            def safe_get_user_id(state):
-                """Defensive user ID extraction for both Pydantic and dict states."""
-                try:
-                    return state.user_id
-                except AttributeError:
-                    return state.get("user_id", "unknown")
-
-            def safe_get_phase(state):
-                """Defensive phase extraction with proper type conversion."""
-                try:
-                    phase = state.workflow_phase
-                except AttributeError:
-                    phase = state.get("workflow_phase")
-
-                if phase is None:
-                    return WorkflowPhase.INITIALIZATION
-
-                if isinstance(phase, str):
-                    return WorkflowPhase(phase)
-                elif isinstance(phase, WorkflowPhase):
-                    return phase
-                else:
-                    return WorkflowPhase.INITIALIZATION
-
-            def safe_get_context_data(state):
-                """Defensive context data extraction."""
-                try:
-                    return state.context_data or {}
-                except AttributeError:
-                    return state.get("context_data", {})
-
-            def safe_get_messages(state):
-                """Defensive messages extraction."""
-                try:
-                    return state.messages or []
-                except AttributeError:
-                    return state.get("messages", [])
-
-            # Use fallback for safe_get
-            safe_get = safe_get_fallback
-
         session_id = safe_get_session_id(state)
         user_id = safe_get_user_id(state)
 
@@ -142,81 +90,70 @@ def create_email_workflow_orchestrator(
             raise SessionSecurityError("Session ownership validation failed")
 
         prev_phase = session_phase_tracker.get(session_id)
+        if prev_phase is not None:
+            session_phase_tracker.move_to_end(session_id)
         enhanced_state = state
 
         # Use defensive state access utilities for LangGraph state conversion
-        current_workflow_phase = safe_get_phase(state)
+        current_phase = safe_get_phase(state)
 
         if prev_phase is None:
-            session_phase_tracker[session_id] = current_workflow_phase
-        elif prev_phase != current_workflow_phase:
+            session_phase_tracker[session_id] = current_phase
+            if len(session_phase_tracker) > _MAX_TRACKED_SESSIONS:
+                session_phase_tracker.popitem(last=False)
+        elif prev_phase is not current_phase:
             session_logger.log_workflow_phase_transition(
                 session_id,
                 user_id,
-                from_phase=prev_phase.value,
-                to_phase=current_workflow_phase.value,
+                from_phase=_PHASE_VALUE[prev_phase],
+                to_phase=_PHASE_VALUE[current_phase],
             )
+            # Only previous_phase changes, so current_phase still holds
             enhanced_state = state.copy(update={"previous_phase": prev_phase})
-            session_phase_tracker[session_id] = current_workflow_phase
-
-        cleanup_counter += 1
-        if cleanup_counter >= 1000 and len(session_phase_tracker) > 10000:
-            for sid in list(session_phase_tracker)[: len(session_phase_tracker) - 5000]:
-                session_phase_tracker.pop(sid, None)
-            cleanup_counter = 0
-
-        # Use defensive state access utilities for LangGraph state conversion
-        current_phase = safe_get_phase(enhanced_state)
+            session_phase_tracker[session_id] = current_phase
 
         messages = safe_get_messages(enhanced_state)
-        orchestrator_messages = extract_agent_messages(
-            messages, "email_workflow_orchestrator"
-        )
         last_user_message = None
 
         for msg in reversed(messages):
-            if msg.__class__.__name__ == "HumanMessage":
+            if isinstance(msg, HumanMessage):
                 last_user_message = msg
                 break
 
         next_agent, routing_message, target_phase = _determine_next_agent_enhanced(
             current_phase,
             enhanced_state,
-            orchestrator_messages,
             last_user_message,
             router,
         )
 
-        # Handle phase transitions for ADVANCE_PHASE routing decisions
-        final_state = enhanced_state
-        if target_phase and target_phase != current_phase:
-            final_state = enhanced_state.transition_to_phase(target_phase)
+        # Handle phase transitions for ADVANCE_PHASE routing decisions; the
+        # transition is applied by the single copy at the end
+        phase_updates: dict[str, Any] = {}
+        final_state_phase = current_phase
+        if target_phase and target_phase is not current_phase:
+            phase_updates = enhanced_state.phase_transition_updates(target_phase)
+            final_state_phase = target_phase
             # Update session tracking for the new phase using defensive session_id access
             session_phase_tracker[session_id] = target_phase
             session_logger.log_workflow_phase_transition(
                 session_id,
                 user_id,
-                from_phase=current_phase.value,
-                to_phase=target_phase.value,
+                from_phase=_PHASE_VALUE[current_phase],
+                to_phase=_PHASE_VALUE[target_phase],
             )
 
         # Use defensive state access utilities for LangGraph state conversion
-        final_state_context = safe_get_context_data(final_state)
-        final_state_phase_value = safe_get_phase(final_state).value
-        final_state_messages = safe_get_messages(final_state)
-        final_state_previous_phase = safe_get(
-            final_state, "previous_phase", WorkflowPhase
-        )
+        final_state_context = safe_get_context_data(enhanced_state)
+        # Phase transitions leave messages untouched
+        final_state_messages = messages
 
         if next_agent and next_agent != "END":
-            # Use defensive state access utilities
-            current_workflow_phase = safe_get_phase(final_state)
-
-            agent_message = create_agent_message(
-                from_agent="email_workflow_orchestrator",
+            agent_message = readdress_agent_message(
+                _ROUTING_MESSAGE_TEMPLATE,
                 to_agent=next_agent,
                 content=routing_message["content"],
-                phase=current_workflow_phase,  # Use the safely retrieved phase
+                phase=final_state_phase,  # Use the safely retrieved phase
                 data=routing_message.get(
                     "data", {}
                 ),  # Defensive programming for data access
@@ -234,15 +171,19 @@ def create_email_workflow_orchestrator(
                     "next_agent": next_agent,
                     "routing_reason": routing_message["reason"],
                     "timestamp": datetime.now().isoformat(),
-                    "phase": final_state_phase_value,
+                    "phase": _PHASE_VALUE[final_state_phase],
                 },
             },
         }
 
-        if final_state_previous_phase is not None:
-            updates["previous_phase"] = final_state_previous_phase
+        if phase_updates:
+            updates.update(phase_updates)
+        else:
+            previous_phase = safe_get(enhanced_state, "previous_phase", WorkflowPhase)
+            if previous_phase is not None:
+                updates["previous_phase"] = previous_phase
 
-        return final_state.copy(update=updates)
+        return enhanced_state.copy(update=updates)
 
     return email_workflow_orchestrator
 
@@ -250,20 +191,11 @@ def create_email_workflow_orchestrator(
 def _determine_next_agent_enhanced(
     current_phase: WorkflowPhase,
     state: UniversalWorkflowState,
-    orchestrator_messages: list[AgentMessage],
     last_user_message: Any | None,
     router: EnhancedWorkflowRouter,
 ) -> tuple[str, dict[str, Any], WorkflowPhase | None]:
     """Enhanced routing decision with error recovery and phase transition info."""
 
-    # Agent to phase mapping
-    agent_phase_map = {
-        "batch_requirements_collector": WorkflowPhase.BATCH_DISCOVERY,
-        "strategy_generator": WorkflowPhase.STRATEGY_ANALYSIS,
-        "strategy_confirmation_handler": WorkflowPhase.STRATEGY_CONFIRMATION,
-        "enhanced_email_generator": WorkflowPhase.GENERATION,
-    }
-
     try:
         if last_user_message:
             command = _detect_global_command(last_user_message.content)
@@ -279,7 +211,7 @@ def _determine_next_agent_enhanced(
             "data": {},
             "reason": routing_result.routing_reason,
             "decision_type": routing_result.decision_type.value,
-            "phase": current_phase.value,
+            "phase": _PHASE_VALUE[current_phase],
             "timestamp": datetime.now().isoformat(),
             "performance_data": {
                 "routing_time_ms": 0,
@@ -300,7 +232,7 @@ def _determine_next_agent_enhanced(
         # Determine target phase for phase transitions
         target_phase = None
         if routing_result.decision_type == RoutingDecision.ADVANCE_PHASE:
-            target_phase = agent_phase_map.get(routing_result.next_node)
+            target_phase = _AGENT_PHASE_MAP.get(routing_result.next_node)
             if target_phase:
                 response_message["target_phase"] = target_phase
 
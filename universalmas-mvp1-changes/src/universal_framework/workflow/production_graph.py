@@ -168,9 +168,9 @@ class EnterpriseStateGraph:
             try:
                 with measure_agent_execution(name, True):
                     if self.config.node_timeout:
-                        result = await asyncio.wait_for(
-                            node_func(state), timeout=self.config.node_timeout
-                        )
+                        # Bounds the await in place; wait_for wraps it in a Task
+                        async with asyncio.timeout(self.config.node_timeout):
+                            result = await node_func(state)
                     else:
                         result = await node_func(state)
                 circuit._record_success()
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar
 
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
+from universal_framework.utils.state_access import safe_get_phase, safe_get_session_id
+
+V = TypeVar("V")
+
+# Default bounds for the per-router caches; the least recently used entry goes
+DEFAULT_ROUTING_CACHE_SIZE = 1024
+_MAX_TRACKED_SESSIONS = 10000
+
+_MISSING = object()
 
 
 class RoutingDecision(Enum):
@@ -19,7 +32,7 @@ class RoutingDecision(Enum):
     COMPLETE = "complete"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoutingResult:
     """Result of routing decision."""
 
@@ -30,6 +43,92 @@ class RoutingResult:
     metadata: dict[str, Any] | None = None
 
 
+# Standard routing per phase; results are frozen, so one instance is shared
+_STANDARD_ROUTES: Mapping[WorkflowPhase, RoutingResult] = MappingProxyType(
+    {
+        WorkflowPhase.INITIALIZATION: RoutingResult(
+            next_node="batch_requirements_collector",
+            routing_reason="start discovery",
+            decision_type=RoutingDecision.ADVANCE_PHASE,
+        ),
+        WorkflowPhase.BATCH_DISCOVERY: RoutingResult(
+            next_node="strategy_generator",
+            routing_reason="requirements collected",
+            decision_type=RoutingDecision.ADVANCE_PHASE,
+        ),
+        WorkflowPhase.STRATEGY_ANALYSIS: RoutingResult(
+            next_node="strategy_confirmation_handler",
+            routing_reason="strategy ready",
+            decision_type=RoutingDecision.ADVANCE_PHASE,
+        ),
+        WorkflowPhase.STRATEGY_CONFIRMATION: RoutingResult(
+            next_node="enhanced_email_generator",
+            routing_reason="strategy confirmed",
+            decision_type=RoutingDecision.ADVANCE_PHASE,
+        ),
+        WorkflowPhase.GENERATION: RoutingResult(
+            next_node="END",
+            routing_reason="generation complete",
+            decision_type=RoutingDecision.COMPLETE,
+        ),
+    }
+)
+
+
+class _LRUCache(Generic[V]):
+    """Bounded mapping that drops the least recently used entry when full.
+
+    Reordering and eviction happen under a lock so a router shared across
+    worker threads cannot lose an entry between lookup and ``move_to_end``.
+    """
+
+    __slots__ = ("maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: V | None = None) -> V | None:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def setdefault(self, key: Hashable, default: V) -> V:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._store(key, default)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: V | None = None) -> V | None:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class EnhancedWorkflowRouter:
     """Simplified enterprise-grade routing engine with circuit breaker."""
 
@@ -37,14 +136,15 @@ class EnhancedWorkflowRouter:
         self,
         use_case_config: dict[str, Any] | None = None,
         performance_mode: bool = True,
+        routing_cache_size: int = DEFAULT_ROUTING_CACHE_SIZE,
     ) -> None:
         self.use_case_config = use_case_config or {}
         self.performance_mode = performance_mode
-        self.routing_cache: dict[str, RoutingResult] = {}
+        self.routing_cache: _LRUCache[RoutingResult] = _LRUCache(routing_cache_size)
 
-        # Circuit breaker for infinite loop prevention
-        self.node_visit_counts: dict[str, dict[str, int]] = (
-            {}
+        # Circuit breaker for infinite loop prevention; idle sessions age out
+        self.node_visit_counts: _LRUCache[dict[str, int]] = _LRUCache(
+            _MAX_TRACKED_SESSIONS
         )  # session_id -> {node: count}
         self.max_node_visits = 3  # Reduced maximum visits to same node per session
 
@@ -63,17 +163,9 @@ class EnhancedWorkflowRouter:
     ) -> RoutingResult:
         """Determine next node with circuit breaker for infinite loop prevention."""
 
-        # Use defensive state access utilities for LangGraph state conversion
-        from universal_framework.utils.state_access import (
-            safe_get_phase,
-            safe_get_session_id,
-        )
-
         session_id = safe_get_session_id(state)
-        if session_id not in self.node_visit_counts:
-            self.node_visit_counts[session_id] = {}
-
-        visit_count = self.node_visit_counts[session_id].get(current_node, 0)
+        session_visits = self.node_visit_counts.setdefault(session_id, {})
+        visit_count = session_visits.get(current_node, 0)
         if visit_count >= self.max_node_visits:
             # Intelligent circuit breaker - force progression based on current phase
             current_phase = safe_get_phase(state)
@@ -100,11 +192,11 @@ class EnhancedWorkflowRouter:
             )
 
         # Increment visit count
-        self.node_visit_counts[session_id][current_node] = visit_count + 1
+        session_visits[current_node] = visit_count + 1
 
         cache_key = self._generate_cache_key(current_node, state, error_context)
-        if self.performance_mode and cache_key in self.routing_cache:
-            result = self.routing_cache[cache_key]
+        result = self.routing_cache.get(cache_key) if self.performance_mode else None
+        if result is not None:
             if result.metadata is None:
                 result = RoutingResult(
                     next_node=result.next_node,
@@ -141,8 +233,7 @@ class EnhancedWorkflowRouter:
 
     def reset_session_state(self, session_id: str) -> None:
         """Reset circuit breaker state for a session."""
-        if session_id in self.node_visit_counts:
-            del self.node_visit_counts[session_id]
+        self.node_visit_counts.pop(session_id, None)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -184,9 +275,6 @@ class EnhancedWorkflowRouter:
         state: UniversalWorkflowState,
         error: dict[str, Any] | None,
     ) -> str:
-        # Use defensive state access utilities for LangGraph state conversion
-        from universal_framework.utils.state_access import safe_get_phase
-
         workflow_phase = safe_get_phase(state)
         return f"{node}-{workflow_phase}-{bool(error)}"
 
@@ -196,48 +284,16 @@ class EnhancedWorkflowRouter:
     def _handle_standard_routing(
         self, current_node: str, state: UniversalWorkflowState
     ) -> RoutingResult:
-        # Use defensive state access utilities for LangGraph state conversion
-        from universal_framework.utils.state_access import safe_get_phase
-
         current_phase = safe_get_phase(state)
 
-        match current_phase:
-            case WorkflowPhase.INITIALIZATION:
-                return RoutingResult(
-                    next_node="batch_requirements_collector",
-                    routing_reason="start discovery",
-                    decision_type=RoutingDecision.ADVANCE_PHASE,
-                )
-            case WorkflowPhase.BATCH_DISCOVERY:
-                return RoutingResult(
-                    next_node="strategy_generator",
-                    routing_reason="requirements collected",
-                    decision_type=RoutingDecision.ADVANCE_PHASE,
-                )
-            case WorkflowPhase.STRATEGY_ANALYSIS:
-                return RoutingResult(
-                    next_node="strategy_confirmation_handler",
-                    routing_reason="strategy ready",
-                    decision_type=RoutingDecision.ADVANCE_PHASE,
-                )
-            case WorkflowPhase.STRATEGY_CONFIRMATION:
-                return RoutingResult(
-                    next_node="enhanced_email_generator",
-                    routing_reason="strategy confirmed",
-                    decision_type=RoutingDecision.ADVANCE_PHASE,
-                )
-            case WorkflowPhase.GENERATION:
-                return RoutingResult(
-                    next_node="END",
-                    routing_reason="generation complete",
-                    decision_type=RoutingDecision.COMPLETE,
-                )
-            case _:
-                return RoutingResult(
-                    next_node="failure_analyst",
-                    routing_reason=f"Unknown phase: {current_phase}",
-                    decision_type=RoutingDecision.ERROR_RECOVERY,
-                )
+        result = _STANDARD_ROUTES.get(current_phase)
+        if result is None:
+            return RoutingResult(
+                next_node="failure_analyst",
+                routing_reason=f"Unknown phase: {current_phase}",
+                decision_type=RoutingDecision.ERROR_RECOVERY,
+            )
+        return result
 
     def _handle_error_recovery_routing(
         self,
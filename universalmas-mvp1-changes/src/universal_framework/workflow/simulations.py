@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from datetime import datetime
 from typing import Any
 
 from universal_framework.contracts.messages import AgentMessage
 from universal_framework.contracts.state import EmailRequirements, EmailStrategy
 
+# Artificial agent latency is opt-in so fallback paths do not stall the loop
+_SIMULATION_DELAY_ENABLED = os.getenv("UF_SIMULATION_DELAYS", "0") == "1"
+
+_TONE_KEYWORDS = ("formal", "professional", "casual")
+_PURPOSE_KEYWORDS = ("update", "announcement", "report")
+
 # ============================================================================
 # SIMULATION FUNCTIONS (LEGACY - DO NOT ALTER NAMES OR CONTRACTS)
 # These functions are maintained for backward compatibility and testing.
@@ -21,7 +28,8 @@ async def _simulate_requirement_collection(
     context: dict[str, Any],
 ) -> dict[str, Any]:
     """Legacy simulation function - DO NOT ALTER."""
-    await asyncio.sleep(0.1)
+    if _SIMULATION_DELAY_ENABLED:
+        await asyncio.sleep(0.1)
     user_input = ""
     for msg in messages:
         if msg.metadata.get("data", {}).get("user_input"):
@@ -30,19 +38,16 @@ async def _simulate_requirement_collection(
     missing_requirements = []
     requirements: dict[str, Any] = {}
     if user_input:
-        if "audience" in user_input.lower():
+        lowered = user_input.lower()
+        if "audience" in lowered:
             requirements["audience"] = "executives"
         else:
             missing_requirements.append("audience")
-        if any(
-            word in user_input.lower() for word in ["formal", "professional", "casual"]
-        ):
+        if any(word in lowered for word in _TONE_KEYWORDS):
             requirements["tone"] = "professional"
         else:
             missing_requirements.append("tone")
-        if any(
-            word in user_input.lower() for word in ["update", "announcement", "report"]
-        ):
+        if any(word in lowered for word in _PURPOSE_KEYWORDS):
             requirements["purpose"] = "update"
         else:
             missing_requirements.append("purpose")
@@ -64,7 +69,8 @@ async def _simulate_strategy_generation(
     context: dict[str, Any],
 ) -> dict[str, Any]:
     """Legacy simulation function - DO NOT ALTER."""
-    await asyncio.sleep(0.15)
+    if _SIMULATION_DELAY_ENABLED:
+        await asyncio.sleep(0.15)
     if not requirements:
         return {
             "status": "failed",
@@ -97,7 +103,8 @@ async def _simulate_confirmation_handling(
     context: dict[str, Any],
 ) -> dict[str, Any]:
     """Legacy simulation function - DO NOT ALTER."""
-    await asyncio.sleep(0.05)
+    if _SIMULATION_DELAY_ENABLED:
+        await asyncio.sleep(0.05)
     return {
         "status": "approved",
         "completion": 1.0,
@@ -114,7 +121,8 @@ async def _simulate_email_generation(
     context: dict[str, Any],
 ) -> dict[str, Any]:
     """Legacy simulation function - DO NOT ALTER."""
-    await asyncio.sleep(0.2)
+    if _SIMULATION_DELAY_ENABLED:
+        await asyncio.sleep(0.2)
     if not approved_strategy:
         return {
             "status": "failed",
@@ -6,6 +6,7 @@ from universal_framework.contracts.messages import (
     AgentMessage,
     create_agent_message,
     extract_agent_messages,
+    readdress_agent_message,
 )
 from universal_framework.contracts.state import (
     UniversalWorkflowState,
@@ -51,6 +52,29 @@ def test_message_validation() -> None:
         )
 
 
+def test_readdressed_message_keeps_sender_and_template() -> None:
+    template = create_agent_message(
+        "agentA", "placeholder", "placeholder", WorkflowPhase.INITIALIZATION
+    )
+
+    msg = readdress_agent_message(
+        template, "agentB", "Hello!", WorkflowPhase.GENERATION, data={"foo": "bar"}
+    )
+
+    assert isinstance(msg, AgentMessage)
+    assert msg.content == "Hello!"
+    assert msg.agent_name == "agentA"
+    assert msg.phase == WorkflowPhase.GENERATION
+    assert msg.metadata["from_agent"] == "agentA"
+    assert msg.metadata["to_agent"] == "agentB"
+    assert msg.metadata["data"] == {"foo": "bar"}
+    assert template.content == "placeholder"
+    assert template.metadata["to_agent"] == "placeholder"
+
+    with pytest.raises(StateValidationError):
+        readdress_agent_message(template, "", "Hello!", WorkflowPhase.GENERATION)
+
+
 def test_message_extraction() -> None:
     m1 = create_agent_message(
         "agentA",
@@ -13,6 +13,7 @@ from universal_framework.contracts.state import (
     UniversalWorkflowState,
     ValidationResult,
     WorkflowPhase,
+    merge_context_data,
 )
 
 
@@ -396,3 +397,31 @@ def test_phase_transition_tracking() -> None:
     same_phase_state = state.transition_to_phase(WorkflowPhase.INITIALIZATION)
     assert same_phase_state.has_phase_transition() is False
     assert same_phase_state.get_transition_context() == {}
+
+
+def test_phase_transition_updates_leave_state_unchanged() -> None:
+    state = UniversalWorkflowState(
+        session_id="s",
+        user_id="u",
+        auth_token="token123456",
+        phase_completion={"initialization": 1.0},
+    )
+    updates = state.phase_transition_updates(WorkflowPhase.BATCH_DISCOVERY)
+
+    assert updates == {
+        "previous_phase": WorkflowPhase.INITIALIZATION,
+        "workflow_phase": WorkflowPhase.BATCH_DISCOVERY,
+        "phase_completion": {"initialization": 1.0, "batch_discovery": 0.0},
+    }
+    assert state.workflow_phase == WorkflowPhase.INITIALIZATION
+    assert state.phase_completion == {"initialization": 1.0}
+
+
+def test_merge_context_data_keeps_existing_keys() -> None:
+    current = {"collected_requirements": {"purpose": "update"}, "step": 1}
+
+    merged = merge_context_data(current, {"step": 2})
+
+    assert merged == {"collected_requirements": {"purpose": "update"}, "step": 2}
+    assert current["step"] == 1
+    assert merge_context_data(current, None) is current
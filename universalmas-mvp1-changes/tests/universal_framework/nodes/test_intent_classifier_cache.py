@@ -0,0 +1,47 @@
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from universal_framework.nodes.agents.intent_classifier_agent import (
+    IntentClassificationResult,
+    IntentClassifierAgent,
+    UserIntent,
+)
+
+
+class _CountingLLM:
+    def __init__(self, confidence: float = 0.9):
+        self.calls = 0
+        self.confidence = confidence
+
+    def with_structured_output(self, schema):
+        def classify(_prompt):
+            self.calls += 1
+            return IntentClassificationResult(
+                intent=UserIntent.GREETING,
+                confidence=self.confidence,
+                reasoning="greeting",
+            )
+
+        return RunnableLambda(classify)
+
+
+@pytest.mark.asyncio
+async def test_repeat_input_skips_llm() -> None:
+    llm = _CountingLLM()
+    agent = IntentClassifierAgent(llm=llm, enable_conversation_aware=False)
+
+    first = await agent._classify_with_structured_llm("Hello  there")
+    second = await agent._classify_with_structured_llm("hello there")
+
+    assert first is second
+    assert llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_low_confidence_result_is_not_cached() -> None:
+    llm = _CountingLLM(confidence=0.5)
+    agent = IntentClassifierAgent(llm=llm, enable_conversation_aware=False)
+
+    assert await agent._classify_with_structured_llm("hmm") is None
+    assert await agent._classify_with_structured_llm("hmm") is None
+    assert llm.calls == 2
@@ -1,16 +1,34 @@
+import asyncio
 import logging
+import threading
+import time
 
 import pytest
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
 
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
 from universal_framework.workflow import MessageHistoryMode
+from universal_framework.workflow import builder as builder_module
 from universal_framework.workflow.builder import (
+    _add_enhanced_conditional_edges,
+    _assemble_streamlined_graph,
+    _create_delivery_coordinator,
+    _create_enhanced_agent_node,
+    _create_intent_gate_node,
+    _create_parallel_synthesizer,
+    _create_quality_validator,
+    _create_workflow_phase_router,
+    _create_speculative_prefetch_node,
+    _find_last_user_message,
+    _get_agent_circuit_breaker,
+    _select_agents,
     create_enhanced_workflow,
     create_streamlined_workflow,
     execute_workflow_step,
     validate_workflow_state,
 )
+from universal_framework.workflow.routing import EnhancedWorkflowRouter
 
 
 @pytest.mark.asyncio
@@ -101,6 +119,35 @@ def test_performance_monitoring(caplog) -> None:
     assert result["valid"]
 
 
+@pytest.mark.parametrize(
+    "raw_phase", ["strategy_confirmation", WorkflowPhase.STRATEGY_CONFIRMATION]
+)
+def test_validate_workflow_state_coerces_phase(raw_phase) -> None:
+    result = validate_workflow_state(
+        {"session_id": "s", "user_id": "u", "workflow_phase": raw_phase}
+    )
+
+    # The confirmation phase requires a generated strategy
+    assert "No strategy generated for confirmation" in result["errors"]
+
+
+def test_validate_workflow_state_warns_on_missing_prerequisite() -> None:
+    result = validate_workflow_state(
+        {"session_id": "s", "user_id": "u", "workflow_phase": "generation"}
+    )
+
+    assert result["valid"] is True
+    assert result["warnings"] == ["No approved strategy for generation"]
+
+
+def test_validate_workflow_state_defaults_unknown_phase() -> None:
+    result = validate_workflow_state(
+        {"session_id": "s", "user_id": "u", "workflow_phase": "not_a_phase"}
+    )
+
+    assert result == {"valid": True, "errors": [], "warnings": []}
+
+
 @pytest.mark.asyncio
 async def test_workflow_builder_message_history_integration(
     sample_state_with_messages,
@@ -120,3 +167,243 @@ async def test_workflow_builder_message_history_integration(
 async def test_create_enhanced_workflow() -> None:
     workflow = create_enhanced_workflow()
     assert workflow is not None
+
+
+class _StubSessionStorage:
+    def __init__(self, data):
+        self.data = data
+
+    async def get_session_data(self, session_id):
+        return self.data
+
+
+@pytest.mark.asyncio
+async def test_intent_gate_consumes_speculative_prefetch() -> None:
+    state = UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+    prefetch = _create_speculative_prefetch_node(_StubSessionStorage({"k": "v"}))
+    gate = _create_intent_gate_node()
+
+    assert await prefetch(state) == {}
+    update = await gate(state)
+
+    assert update["context_data"]["prefetched_session"] == {"k": "v"}
+
+
+@pytest.mark.asyncio
+async def test_intent_gate_discards_prefetch_for_help() -> None:
+    state = UniversalWorkflowState(
+        session_id="s",
+        user_id="u",
+        auth_token="t" * 10,
+        context_data={"message_type": "help_response"},
+    )
+    prefetch = _create_speculative_prefetch_node(_StubSessionStorage({"k": "v"}))
+    gate = _create_intent_gate_node()
+
+    await prefetch(state)
+
+    assert await gate(state) == {}
+    # The discarded prefetch is not left behind for the next turn
+    assert await gate(state.copy(update={"context_data": {}})) == {}
+
+
+
+@pytest.mark.asyncio
+async def test_parallel_branches_merge_at_synthesizer() -> None:
+    graph = StateGraph(UniversalWorkflowState)
+
+    async def generator(state):
+        return {"context_data": {"generated_email": {"subject": "Hi"}}}
+
+    graph.add_node("enhanced_email_generator", generator)
+    graph.add_node("quality_validator", _create_quality_validator())
+    graph.add_node("delivery_coordinator", _create_delivery_coordinator())
+    graph.add_node("parallel_synthesizer", _create_parallel_synthesizer())
+    graph.add_edge(START, "enhanced_email_generator")
+    graph.add_edge("enhanced_email_generator", "quality_validator")
+    graph.add_edge("enhanced_email_generator", "delivery_coordinator")
+    graph.add_edge(
+        ["quality_validator", "delivery_coordinator"], "parallel_synthesizer"
+    )
+    graph.add_edge("parallel_synthesizer", END)
+
+    result = await graph.compile().ainvoke(
+        UniversalWorkflowState(
+            session_id="s",
+            user_id="u",
+            auth_token="t" * 10,
+            context_data={"collected_requirements": {"purpose": "update"}},
+        )
+    )
+
+    assert result["workflow_phase"] == WorkflowPhase.DELIVERY
+    # Partial context_data updates merge instead of replacing earlier keys
+    assert result["context_data"]["collected_requirements"] == {"purpose": "update"}
+    assert result["context_data"]["generated_email"] == {"subject": "Hi"}
+    assert result["context_data"]["quality_validation"]["passed"] is True
+    assert result["context_data"]["delivery_status"]["ready"] is True
+
+
+def test_enhanced_edges_fan_out_generator_when_parallel() -> None:
+    graph = StateGraph(UniversalWorkflowState)
+    agents = ["strategy_generator", "enhanced_email_generator"]
+    graph.add_node("quality_validator", _create_quality_validator())
+    graph.add_node("delivery_coordinator", _create_delivery_coordinator())
+    graph.add_node("parallel_synthesizer", _create_parallel_synthesizer())
+
+    _add_enhanced_conditional_edges(
+        graph, EnhancedWorkflowRouter(), agents, enable_parallel=True
+    )
+
+    assert ("enhanced_email_generator", "quality_validator") in graph.edges
+    assert ("enhanced_email_generator", "delivery_coordinator") in graph.edges
+    assert (
+        ("quality_validator", "delivery_coordinator"),
+        "parallel_synthesizer",
+    ) in graph.waiting_edges
+    assert "enhanced_email_generator" not in graph.branches
+    assert "strategy_generator" in graph.branches
+
+
+@pytest.mark.parametrize(
+    ("next_agent", "expected"),
+    [
+        ("strategy_generator", "strategy_generator"),
+        ("END", END),
+        ("unknown_agent", END),
+        ({"not": "hashable"}, END),
+    ],
+)
+def test_workflow_phase_router_targets(next_agent, expected) -> None:
+    route = _create_workflow_phase_router()
+    state = {"context_data": {"workflow_orchestration": {"next_agent": next_agent}}}
+
+    assert route(state) == expected
+
+
+def test_streamlined_graph_assembly_is_cached() -> None:
+    _assemble_streamlined_graph.cache_clear()
+
+    first = create_streamlined_workflow(use_real_agents=False)
+    second = create_streamlined_workflow(use_real_agents=False)
+
+    assert _assemble_streamlined_graph.cache_info().hits == 1
+    # Each call still compiles with its own checkpointer
+    assert first is not second
+
+
+def test_find_last_user_message_skips_assistant_turns() -> None:
+    messages = [
+        HumanMessage(content="first"),
+        HumanMessage(content="second"),
+        AIMessage(content="reply", name="assistant_orchestrator"),
+    ]
+
+    assert _find_last_user_message(messages) == "second"
+    assert _find_last_user_message([]) is None
+
+
+@pytest.mark.asyncio
+async def test_enhanced_agent_node_runs_sync_agent(monkeypatch) -> None:
+    def sync_agent(state):
+        return state.copy(update={"context_data": {"ran": True}})
+
+    monkeypatch.setattr(
+        builder_module, "_select_agents", lambda *args: {"sync_agent": sync_agent}
+    )
+    node = _create_enhanced_agent_node("sync_agent", use_real_agents=False)
+
+    result = await node(
+        UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+    )
+
+    assert result.context_data["ran"] is True
+    assert result.context_data["agent_execution_failed"] is False
+
+
+@pytest.mark.asyncio
+async def test_enhanced_agent_node_resolves_agent_once(monkeypatch) -> None:
+    lookups = []
+
+    async def async_agent(state):
+        return state
+
+    def select_agents(*args):
+        lookups.append(args)
+        return {"async_agent": async_agent}
+
+    monkeypatch.setattr(builder_module, "_select_agents", select_agents)
+    node = _create_enhanced_agent_node("async_agent", use_real_agents=False)
+    state = UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+
+    await node(state)
+    await node(state)
+
+    assert len(lookups) == 1
+
+
+def test_select_agents_reuses_agent_nodes() -> None:
+    simulated = _select_agents(False, None)
+
+    assert simulated is _select_agents(False, None)
+    assert set(simulated) == {
+        "batch_requirements_collector",
+        "strategy_generator",
+        "strategy_confirmation_handler",
+        "enhanced_email_generator",
+    }
+
+
+def test_agent_circuit_breaker_is_shared_per_agent() -> None:
+    breaker = _get_agent_circuit_breaker("strategy_generator")
+
+    assert _get_agent_circuit_breaker("strategy_generator") is breaker
+    assert _get_agent_circuit_breaker("enhanced_email_generator") is not breaker
+
+
+@pytest.mark.asyncio
+async def test_agent_semaphore_limits_concurrent_agents(monkeypatch) -> None:
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_agent(state):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return state
+
+    monkeypatch.setattr(
+        builder_module, "_select_agents", lambda *args: {"slow_agent": slow_agent}
+    )
+    node = _create_enhanced_agent_node(
+        "slow_agent", use_real_agents=False, agent_semaphore=asyncio.Semaphore(1)
+    )
+    state = UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+
+    await asyncio.gather(node(state), node(state), node(state))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_enhanced_agent_node_runs_async_agent(monkeypatch) -> None:
+    async def async_agent(state):
+        return state.copy(update={"context_data": {"ran": True}})
+
+    monkeypatch.setattr(
+        builder_module, "_select_agents", lambda *args: {"async_agent": async_agent}
+    )
+    node = _create_enhanced_agent_node("async_agent", use_real_agents=False)
+
+    result = await node(
+        UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+    )
+
+    assert result.context_data["ran"] is True
+    assert result.context_data["agent_execution_failed"] is False
+    assert result.audit_trail[-1]["success"] is True
@@ -0,0 +1,37 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from universal_framework.workflow.error_recovery import (
+    AgentCircuitBreaker,
+    AgentStatus,
+)
+
+
+async def _failing_agent(value):
+    raise RuntimeError("boom")
+
+
+async def _echo(value):
+    return value
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_agent_until_recovery_timeout() -> None:
+    breaker = AgentCircuitBreaker(
+        failure_threshold=1, recovery_timeout=timedelta(seconds=30)
+    )
+
+    assert await breaker.execute_with_fallback(_failing_agent, _echo, "x") == (
+        "x",
+        False,
+    )
+    assert breaker.state.status is AgentStatus.FAILED
+    assert breaker._should_skip_real_agent() is True
+
+    # Pretend the recovery timeout has elapsed
+    breaker._skip_until = time.monotonic() - 1
+
+    assert await breaker.execute_with_fallback(_echo, _echo, "y") == ("y", True)
+    assert breaker.state.status is AgentStatus.HEALTHY
@@ -0,0 +1,27 @@
+from langgraph.graph import END, START, StateGraph
+
+from universal_framework.contracts.state import UniversalWorkflowState
+from universal_framework.workflow import graph as graph_module
+
+
+def _stub_workflow(checkpointer=None):
+    workflow = StateGraph(UniversalWorkflowState)
+    workflow.add_node("noop", lambda state: {})
+    workflow.add_edge(START, "noop")
+    workflow.add_edge("noop", END)
+    return workflow.compile()
+
+
+def test_workflow_graph_is_compiled_once_per_config(monkeypatch) -> None:
+    monkeypatch.setattr(graph_module, "create_streamlined_workflow", _stub_workflow)
+    graph_module._compile_workflow_graph.cache_clear()
+
+    first = graph_module.create_workflow_graph()
+    second = graph_module.create_workflow_with_config()
+    custom = graph_module.create_workflow_with_config({"recursion_limit": 50})
+
+    assert first is second
+    assert custom is not first
+    assert first.config["recursion_limit"] == 200
+    assert custom.config["recursion_limit"] == 50
+    graph_module._compile_workflow_graph.cache_clear()
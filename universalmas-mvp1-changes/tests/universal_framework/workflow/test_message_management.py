@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
 
 from universal_framework.contracts.messages import create_agent_message
 from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
@@ -336,3 +341,152 @@ def test_binary_search_context_preservation():
     assert result[0].content == "recent human 2"
     assert result[1].content == "ai 2"
     assert result[2].content == "ai 3"
+
+
+def test_context_search_finds_human_skipped_by_bisection():
+    """The newest HumanMessage before the window is found wherever it sits."""
+    messages = [
+        AIMessage(content="ai 0"),
+        HumanMessage(content="human 1"),
+        AIMessage(content="ai 2"),
+        AIMessage(content="ai 3"),
+        AIMessage(content="ai 4"),
+        AIMessage(content="ai 5"),
+        AIMessage(content="ai 6"),
+    ]
+
+    state = UniversalWorkflowState(session_id="bs", user_id="u", auth_token="t" * 10)
+    filter_instance = OptimizedSlidingWindowFilter(window_size=2)
+    result = filter_instance.filter_messages(messages, state)
+
+    assert [m.content for m in result] == ["human 1", "ai 5", "ai 6"]
+
+
+def test_conversation_themes_capped_in_theme_order():
+    filter_instance = SummarizedFilter()
+    themes = filter_instance._extract_conversation_themes(
+        ["Send a formal email with a plan", "We need to review and create it ASAP"]
+    )
+
+    assert themes == ["email", "strategy", "requirements", "analysis", "generation"]
+
+
+def test_role_filtered_filter_resolves_subclasses():
+    messages = [
+        HumanMessage(content="hi"),
+        AIMessageChunk(content="partial"),
+        SystemMessage(content="system"),
+        create_agent_message("agent", "user", "note", WorkflowPhase.INITIALIZATION),
+    ]
+    state = UniversalWorkflowState(session_id="rf", user_id="u", auth_token="t" * 10)
+
+    result = RoleFilteredFilter(["assistant", "agent"]).filter_messages(
+        messages, state
+    )
+
+    assert [m.content for m in result] == ["partial", "note"]
+
+
+def test_process_messages_returns_state_when_unfiltered():
+    state = UniversalWorkflowState(
+        session_id="pm",
+        user_id="u",
+        auth_token="t" * 10,
+        messages=[HumanMessage(content="hi")],
+    )
+
+    assert MessageHistoryManager().process_messages(state) is state
+    assert (
+        MessageHistoryManager(MessageHistoryMode.LAST_MESSAGE).process_messages(state)
+        is state
+    )
+
+
+def test_history_managers_share_filters_per_config():
+    first = MessageHistoryManager(MessageHistoryMode.SLIDING_WINDOW, window_size=4)
+    second = MessageHistoryManager(MessageHistoryMode.SLIDING_WINDOW, window_size=4)
+    other = MessageHistoryManager(MessageHistoryMode.SLIDING_WINDOW, window_size=8)
+    roles = MessageHistoryManager(
+        MessageHistoryMode.ROLE_FILTERED, included_roles=["human"]
+    )
+
+    assert first.filter is second.filter
+    assert other.filter is not first.filter
+    assert roles.filter.included_roles == ["human"]
+
+
+def test_conversation_summary_counts_agent_responses():
+    messages = [
+        HumanMessage(content="Draft an update"),
+        AIMessage(content="x" * 500),
+        create_agent_message("agent", "user", "note", WorkflowPhase.INITIALIZATION),
+    ]
+    state = UniversalWorkflowState(session_id="cs", user_id="u", auth_token="t" * 10)
+
+    summary = SummarizedFilter()._create_conversation_summary(messages, state)
+
+    assert "Agent responses: 2" in summary
+    assert summary.endswith("Message span: 3 messages")
+
+
+def test_phase_scoped_filter_matches_raw_phase_values():
+    messages = [
+        HumanMessage(content="hi"),
+        create_agent_message("agent", "user", "enum", WorkflowPhase.GENERATION),
+        create_agent_message("agent", "user", "raw", "generation"),
+        create_agent_message("agent", "user", "other", WorkflowPhase.REVIEW),
+    ]
+    state = UniversalWorkflowState(
+        session_id="ps",
+        user_id="u",
+        auth_token="t" * 10,
+        workflow_phase=WorkflowPhase.GENERATION,
+    )
+
+    result = PhaseScopedFilter().filter_messages(messages, state)
+
+    assert [m.content for m in result] == ["enum", "raw"]
+
+
+def test_sliding_window_skips_coordination_without_redis(monkeypatch):
+    messages = [HumanMessage(content=f"m{i}") for i in range(6)]
+    state = UniversalWorkflowState(session_id="sw", user_id="u", auth_token="t" * 10)
+    filter_instance = OptimizedSlidingWindowFilter(window_size=3)
+
+    def fail(_self, _state):
+        raise AssertionError("coordination payload built without a coordinator")
+
+    monkeypatch.setattr(OptimizedSlidingWindowFilter, "_coordinate_with_redis", fail)
+
+    result = filter_instance.filter_messages(messages, state)
+
+    assert [m.content for m in result] == ["m3", "m4", "m5"]
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        OptimizedSlidingWindowFilter(window_size=3),
+        RoleFilteredFilter(["human"]),
+        SummarizedFilter(),
+        MessageHistoryManager(),
+    ],
+)
+def test_filters_use_slots(instance):
+    assert not hasattr(instance, "__dict__")
+
+
+def test_phase_resolved_from_dict_state():
+    messages = [
+        create_agent_message("agent", "user", "review", WorkflowPhase.REVIEW),
+        create_agent_message("agent", "user", "init", WorkflowPhase.INITIALIZATION),
+    ] + [HumanMessage(content=f"m{i}") for i in range(3)]
+    state = {"workflow_phase": "review", "session_id": "dict"}
+
+    scoped = PhaseScopedFilter().filter_messages(messages, state)
+    summary = SummarizedFilter(summary_threshold=2, keep_recent=1).filter_messages(
+        messages, state
+    )
+
+    assert [m.content for m in scoped] == ["review"]
+    assert summary[0].metadata["workflow_phase"] == "review"
@@ -346,3 +346,37 @@ async def test_no_logging_same_phase() -> None:
     with patch.object(SessionFlowLogger, "log_workflow_phase_transition") as mock_log:
         await orchestrator(same_phase_state)
         mock_log.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_phase_tracker_drops_least_recent_session(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "universal_framework.workflow.orchestrator._MAX_TRACKED_SESSIONS", 2
+    )
+    # Call the undecorated node; only the tracker is under test here
+    orchestrator = create_email_workflow_orchestrator(
+        ["batch_requirements_collector"]
+    ).__wrapped__
+
+    def state(session_id: str, phase: WorkflowPhase) -> UniversalWorkflowState:
+        return UniversalWorkflowState(
+            session_id=session_id,
+            user_id="user",
+            auth_token="tok0987654321",
+            workflow_phase=phase,
+        )
+
+    for session_id in ("a", "b", "a", "c"):
+        await orchestrator(state(session_id, WorkflowPhase.INITIALIZATION))
+
+    with patch.object(SessionFlowLogger, "log_workflow_phase_transition") as mock_log:
+        await orchestrator(state("a", WorkflowPhase.REVIEW))
+        await orchestrator(state("b", WorkflowPhase.REVIEW))
+
+    # Only the tracker logs a transition into the phase the state arrives in
+    tracked = [
+        call.args[0]
+        for call in mock_log.call_args_list
+        if call.kwargs["to_phase"] == WorkflowPhase.REVIEW.value
+    ]
+    assert tracked == ["a"]
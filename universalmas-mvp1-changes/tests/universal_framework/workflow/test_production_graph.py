@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from universal_framework.contracts.state import UniversalWorkflowState
+from universal_framework.workflow.production_graph import (
+    EnterpriseGraphConfig,
+    EnterpriseStateGraph,
+)
+
+
+def _state() -> UniversalWorkflowState:
+    return UniversalWorkflowState(session_id="s", user_id="u", auth_token="t" * 10)
+
+
+async def _slow(state):
+    await asyncio.sleep(1)
+    return state
+
+
+async def _fast(state):
+    return state.copy(update={"current_node": "fast"})
+
+
+@pytest.mark.asyncio
+async def test_wrapped_node_times_out_into_error_info() -> None:
+    graph = EnterpriseStateGraph(
+        UniversalWorkflowState, EnterpriseGraphConfig(node_timeout=0.01)
+    )
+
+    result = await graph._wrap_node("slow", _slow)(_state())
+
+    assert result.error_info["node"] == "slow"
+
+
+@pytest.mark.asyncio
+async def test_wrapped_node_returns_result_within_timeout() -> None:
+    graph = EnterpriseStateGraph(
+        UniversalWorkflowState, EnterpriseGraphConfig(node_timeout=1.0)
+    )
+
+    result = await graph._wrap_node("fast", _fast)(_state())
+
+    assert result.current_node == "fast"
+    assert result.error_info is None
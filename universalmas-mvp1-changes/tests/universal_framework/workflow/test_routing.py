@@ -1,7 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from universal_framework.contracts.state import UniversalWorkflowState
-from universal_framework.workflow.routing import EnhancedWorkflowRouter, RoutingDecision
+from universal_framework.contracts.state import UniversalWorkflowState, WorkflowPhase
+from universal_framework.workflow.routing import (
+    EnhancedWorkflowRouter,
+    RoutingDecision,
+    RoutingResult,
+)
 
 
 @pytest.mark.asyncio
@@ -11,3 +17,109 @@ async def test_enhanced_router_basic_routing() -> None:
     result = router.route_from_node("email_workflow_orchestrator", state)
     assert isinstance(result.next_node, str)
     assert result.decision_type in RoutingDecision
+
+
+def _state(session_id: str, phase: WorkflowPhase) -> UniversalWorkflowState:
+    return UniversalWorkflowState(
+        session_id=session_id, user_id="u", auth_token="t" * 10, workflow_phase=phase
+    )
+
+
+def test_routing_cache_keeps_most_recent_entries() -> None:
+    router = EnhancedWorkflowRouter(routing_cache_size=2)
+
+    router.route_from_node("a", _state("s1", WorkflowPhase.INITIALIZATION))
+    router.route_from_node("b", _state("s1", WorkflowPhase.INITIALIZATION))
+    hit = router.route_from_node("a", _state("s2", WorkflowPhase.INITIALIZATION))
+    router.route_from_node("c", _state("s1", WorkflowPhase.INITIALIZATION))
+
+    assert hit.metadata == {"cache_hit": True}
+    assert len(router.routing_cache) == 2
+    state = _state("s3", WorkflowPhase.INITIALIZATION)
+    assert router._generate_cache_key("a", state, None) in router.routing_cache
+    assert router._generate_cache_key("b", state, None) not in router.routing_cache
+
+
+def test_routing_cache_survives_concurrent_threads() -> None:
+    router = EnhancedWorkflowRouter(routing_cache_size=4)
+    phases = list(WorkflowPhase)
+
+    def route(worker: int) -> None:
+        for i in range(500):
+            state = _state(f"s{worker}-{i}", phases[i % len(phases)])
+            router.route_from_node(f"node{i % 7}", state)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(route, range(8)))
+
+    assert len(router.routing_cache) == 4
+
+
+def test_visit_counts_drop_least_recent_session(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "universal_framework.workflow.routing._MAX_TRACKED_SESSIONS", 2
+    )
+    router = EnhancedWorkflowRouter()
+
+    for session_id in ("a", "b", "a", "c"):
+        router.route_from_node("node", _state(session_id, WorkflowPhase.GENERATION))
+
+    assert "a" in router.node_visit_counts
+    assert "b" not in router.node_visit_counts
+    assert "c" in router.node_visit_counts
+
+    router.reset_session_state("a")
+    assert "a" not in router.node_visit_counts
+
+
+def test_cached_repeats_still_trip_circuit_breaker() -> None:
+    router = EnhancedWorkflowRouter()
+    state = _state("loop", WorkflowPhase.BATCH_DISCOVERY)
+
+    results = [router.route_from_node("node", state) for _ in range(4)]
+
+    assert results[1].metadata == {"cache_hit": True}
+    assert results[3].recovery_path == "forced_progression"
+    assert results[3].next_node == "strategy_generator"
+
+
+@pytest.mark.parametrize(
+    ("phase", "next_node", "decision_type"),
+    [
+        (
+            WorkflowPhase.INITIALIZATION,
+            "batch_requirements_collector",
+            RoutingDecision.ADVANCE_PHASE,
+        ),
+        (
+            WorkflowPhase.BATCH_DISCOVERY,
+            "strategy_generator",
+            RoutingDecision.ADVANCE_PHASE,
+        ),
+        (
+            WorkflowPhase.STRATEGY_ANALYSIS,
+            "strategy_confirmation_handler",
+            RoutingDecision.ADVANCE_PHASE,
+        ),
+        (
+            WorkflowPhase.STRATEGY_CONFIRMATION,
+            "enhanced_email_generator",
+            RoutingDecision.ADVANCE_PHASE,
+        ),
+        (WorkflowPhase.GENERATION, "END", RoutingDecision.COMPLETE),
+        (WorkflowPhase.REVIEW, "failure_analyst", RoutingDecision.ERROR_RECOVERY),
+    ],
+)
+def test_standard_routing_per_phase(phase, next_node, decision_type) -> None:
+    router = EnhancedWorkflowRouter(performance_mode=False)
+
+    result = router.route_from_node("email_workflow_orchestrator", _state("s", phase))
+
+    assert result.next_node == next_node
+    assert result.decision_type is decision_type
+
+
+def test_routing_result_has_no_instance_dict() -> None:
+    result = RoutingResult("END", "done", RoutingDecision.COMPLETE)
+
+    assert not hasattr(result, "__dict__")
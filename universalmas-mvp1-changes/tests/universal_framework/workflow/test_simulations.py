@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from universal_framework.contracts.messages import create_agent_message
+from universal_framework.contracts.state import WorkflowPhase
+from universal_framework.workflow import simulations
+
+
+async def _fail_sleep(delay):
+    raise AssertionError(f"unexpected sleep({delay})")
+
+
+@pytest.mark.asyncio
+async def test_simulations_skip_delays_by_default(monkeypatch) -> None:
+    monkeypatch.setattr(simulations, "_SIMULATION_DELAY_ENABLED", False)
+    monkeypatch.setattr(asyncio, "sleep", _fail_sleep)
+
+    result = await simulations._simulate_confirmation_handling([], {"a": 1}, {})
+
+    assert result["approved"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("user_input", "missing"),
+    [
+        ("Formal UPDATES for the Audience", []),
+        ("casual note", ["audience", "purpose"]),
+        ("quarterly reports", ["audience", "tone"]),
+    ],
+)
+async def test_requirement_collection_keyword_matching(user_input, missing) -> None:
+    message = create_agent_message(
+        "user",
+        "collector",
+        "input",
+        WorkflowPhase.BATCH_DISCOVERY,
+        data={"user_input": user_input},
+    )
+
+    result = await simulations._simulate_requirement_collection([message], {})
+
+    assert result["missing_requirements"] == missing
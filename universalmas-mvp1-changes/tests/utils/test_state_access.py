@@ -0,0 +1,114 @@
+import pytest
+from langchain_core.messages import HumanMessage
+
+from universal_framework.contracts.state import (
+    EmailRequirements,
+    UniversalWorkflowState,
+    WorkflowPhase,
+)
+from universal_framework.utils.state_access import as_state_view, ensure_state_type
+
+
+def _requirements_dict() -> dict:
+    return {
+        "purpose": "Quarterly results update",
+        "email_type": "update",
+        "audience": ["team@example.com"],
+        "tone": "professional",
+        "key_messages": ["Revenue grew"],
+    }
+
+
+class TestEnsureStateType:
+    def test_default_path_validates_and_coerces(self):
+        state = ensure_state_type(
+            {
+                "session_id": "s-1",
+                "user_id": "u-1",
+                "auth_token": "t" * 10,
+                "workflow_phase": "generation",
+                "email_requirements": _requirements_dict(),
+                "messages": [HumanMessage(content="hi")],
+            }
+        )
+
+        assert isinstance(state, UniversalWorkflowState)
+        assert state.workflow_phase is WorkflowPhase.GENERATION
+        assert isinstance(state.email_requirements, EmailRequirements)
+
+    def test_trusted_path_reuses_validated_values(self):
+        source = UniversalWorkflowState(
+            session_id="s-1",
+            user_id="u-1",
+            auth_token="t" * 10,
+            workflow_phase=WorkflowPhase.REVIEW,
+            email_requirements=EmailRequirements(**_requirements_dict()),
+        )
+
+        state = ensure_state_type(dict(source), trusted=True)
+
+        assert isinstance(state, UniversalWorkflowState)
+        assert state.workflow_phase is WorkflowPhase.REVIEW
+        assert state.email_requirements is source.email_requirements
+
+    def test_trusted_dict_with_raw_phase_is_validated(self):
+        state = ensure_state_type(
+            {
+                "session_id": "s-1",
+                "user_id": "u-1",
+                "auth_token": "t" * 10,
+                "workflow_phase": "review",
+            },
+            trusted=True,
+        )
+
+        assert state.workflow_phase is WorkflowPhase.REVIEW
+
+    def test_trusted_dict_missing_required_keys_is_validated(self):
+        state = ensure_state_type(
+            {"session_id": "s-1", "auth_token": "t" * 10}, trusted=True
+        )
+
+        # Validation fails on the missing user and falls back to the minimal state
+        assert isinstance(state, UniversalWorkflowState)
+        assert state.session_id == "s-1"
+        assert state.user_id == "unknown"
+
+    def test_invalid_dict_recovers_minimal_state(self):
+        state = ensure_state_type(
+            {
+                "session_id": "s-1",
+                "user_id": "u-1",
+                "auth_token": "t" * 10,
+                "workflow_phase": "not_a_phase",
+            }
+        )
+
+        assert isinstance(state, UniversalWorkflowState)
+        assert state.session_id == "s-1"
+        assert state.workflow_phase is WorkflowPhase.INITIALIZATION
+
+
+class TestAsStateView:
+    def test_model_state_exposes_fields_read_only(self):
+        state = UniversalWorkflowState(
+            session_id="s-1",
+            user_id="u-1",
+            auth_token="t" * 10,
+            context_data={"k": "v"},
+        )
+
+        view = as_state_view(state)
+
+        assert view["session_id"] == "s-1"
+        assert view.get("context_data") is state.context_data
+        with pytest.raises(TypeError):
+            view["session_id"] = "other"
+
+    def test_dict_state_is_returned_as_is(self):
+        state = {"session_id": "s-1"}
+
+        assert as_state_view(state) is state
+
+    def test_other_values_give_empty_view(self):
+        assert as_state_view(None).get("session_id", "default") == "default"
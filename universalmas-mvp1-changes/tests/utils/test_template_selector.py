@@ -67,6 +67,27 @@ class TestEmailTemplateSelector:
             )
             assert self.selector.select_template(strategy) == expected
 
+    def test_keyword_table_is_shared_and_read_only(self):
+        other = EmailTemplateSelector()
+        assert other._TEMPLATE_KEYWORDS is self.selector._TEMPLATE_KEYWORDS
+        with pytest.raises(TypeError):
+            self.selector._TEMPLATE_KEYWORDS[EmailTemplateType.TEAM_NOTIFICATION] = (
+                frozenset()
+            )
+
+    def test_overlapping_keywords_keep_priority_order(self):
+        strategy = EmailStrategy(
+            overall_approach="",
+            tone_strategy="",
+            structure_strategy=[],
+            messaging_strategy={},
+            personalization_strategy={},
+            estimated_impact="",
+            confidence_score=1.0,
+            content="Team training on the new policy",
+        )
+        assert self.selector.select_template(strategy) == "policy_communication"
+
     def test_get_available_templates(self):
         templates = self.selector.get_available_templates()
         expected = [t.value for t in EmailTemplateType]
@@ -40,6 +40,7 @@ def test_redis_configuration_fields():
         "redis_db": str,  # String for safe parsing
         "redis_password": (str, type(None)),  # Optional[str]
         "redis_ttl_hours": str,  # String for safe parsing
+        "redis_pool_size": str,  # String for safe parsing
         "redis_url": (str, type(None)),  # Optional[str] - NEW requirement
     }
 